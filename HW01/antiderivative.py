@@ -0,0 +1,120 @@
+"""
+反導函數 F(x) = ∫_origin^x f(t) dt 的累積積分表
+以固定步長把實數軸切成一段一段 (segment)，每段存節點上的 F 與 f，
+查詢時用三次 Hermite 插值；需要新的範圍時才建表，超過記憶體上限就丟掉最久沒用的段。
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from quadrature import evaluate, quad
+
+# 每個小格用 2 點 Gauss–Legendre 積分 (對三次多項式精確)
+_GAUSS2 = np.array([0.5 - 0.5 / np.sqrt(3), 0.5 + 0.5 / np.sqrt(3)])
+
+
+class Antiderivative:
+    def __init__(self, f, origin=0.0, step=1e-3, segment_size=1024, max_bytes=32 * 2**20):
+        """
+        參數:
+            f: 被積函數，最好能接受 numpy 陣列
+            origin: 積分起點，F(origin) = 0
+            step: 表格的節點間距
+            segment_size: 每段的格數
+            max_bytes: 所有段的表格合計的記憶體上限
+        """
+        self.f = f
+        self.origin = float(origin)
+        self.step = float(step)
+        self.segment_size = int(segment_size)
+        self.width = self.step * self.segment_size
+
+        segment_bytes = 2 * (self.segment_size + 1) * 8
+        self.max_segments = max(1, max_bytes // segment_bytes)
+
+        self._segments = OrderedDict()  # k -> (F 節點值, f 節點值)
+        self._boundary = {0: 0.0}       # k -> F(origin + k * width)，只佔一個浮點數，不會被丟掉
+        self.neval = 0
+
+    def __repr__(self):
+        return f"Antiderivative(origin={self.origin}, step={self.step}, segments={len(self._segments)})"
+
+    def _f(self, x):
+        self.neval += x.size
+        return evaluate(self.f, x)
+
+    def _table(self, k):
+        """計算第 k 段的相對累積積分表 (從段的左端點算起) 與節點上的 f。"""
+        a = self.origin + k * self.width
+        nodes = a + self.step * np.arange(self.segment_size + 1)
+        x = nodes[:-1, None] + self.step * _GAUSS2
+        cells = self._f(x).sum(axis=1) * (self.step / 2)
+        cumulative = np.concatenate([[0.0], np.cumsum(cells)])
+        return cumulative, self._f(nodes)
+
+    def _boundary_value(self, k):
+        """回傳 F(origin + k * width)，必要時從最近的已知邊界用 quad 直接積分過去 (不建中間各段的表)。"""
+        if k in self._boundary:
+            return self._boundary[k]
+        j = min(self._boundary, key=lambda i: abs(i - k))
+        r = quad(self.f, self.origin + j * self.width, self.origin + k * self.width)
+        self.neval += r.neval
+        self._boundary[k] = self._boundary[j] + r.value
+        return self._boundary[k]
+
+    def _segment(self, k):
+        if k in self._segments:
+            self._segments.move_to_end(k)
+            return self._segments[k]
+
+        cumulative, fx = self._table(k)
+        if k >= 0:
+            F = self._boundary_value(k) + cumulative
+            self._boundary.setdefault(k + 1, F[-1])
+        else:
+            F = self._boundary_value(k + 1) - cumulative[-1] + cumulative
+            self._boundary.setdefault(k, F[0])
+
+        self._segments[k] = (F, fx)
+        while len(self._segments) > self.max_segments:
+            self._segments.popitem(last=False)
+        return F, fx
+
+    def _interpolate(self, x, derivative):
+        x = np.asarray(x, dtype=float)
+        t = (x - self.origin) / self.width
+        k = np.floor(t).astype(int)
+        out = np.empty_like(x)
+
+        for seg in np.unique(k):
+            mask = k == seg
+            F, fx = self._segment(int(seg))
+            s = (t[mask] - seg) * self.segment_size
+            i = np.clip(np.floor(s).astype(int), 0, self.segment_size - 1)
+            u = s - i
+            h = self.step
+
+            if derivative:
+                # 三次 Hermite 基底函數對 x 的導數
+                d00 = (6 * u**2 - 6 * u) / h
+                d10 = 3 * u**2 - 4 * u + 1
+                d01 = (-6 * u**2 + 6 * u) / h
+                d11 = 3 * u**2 - 2 * u
+                out[mask] = d00 * F[i] + d10 * fx[i] + d01 * F[i + 1] + d11 * fx[i + 1]
+            else:
+                h00 = 2 * u**3 - 3 * u**2 + 1
+                h10 = u**3 - 2 * u**2 + u
+                h01 = -2 * u**3 + 3 * u**2
+                h11 = u**3 - u**2
+                out[mask] = h00 * F[i] + h10 * h * fx[i] + h01 * F[i + 1] + h11 * h * fx[i + 1]
+
+        return out if out.ndim else float(out)
+
+    def __call__(self, x):
+        """F(x)，x 可為純量或 numpy 陣列。"""
+        return self._interpolate(x, derivative=False)
+
+    def derivative(self, x):
+        """插值多項式的導數 F'(x)，應接近 f(x)。"""
+        return self._interpolate(x, derivative=True)
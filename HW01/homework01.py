@@ -1,26 +1,73 @@
-h = 0.00001
+import numpy as np
 
-def df(f, x):
-    return (f(x+h)-f(x))/h 
+from antiderivative import Antiderivative
+from quadrature import evaluate, quad
 
-def integral(f, a, b):
-    x = a
-    area = 0
-    while x<b:
-        area += f(x)*h
-        x+=h
-    return area
+EPS = np.finfo(float).eps
+
+# 各差分法的自動步長：截斷誤差與捨入誤差平衡時的 h ~ eps^(1/(p+1))
+STEP = {
+    'forward': EPS ** (1/2),
+    'central': EPS ** (1/3),
+    'five-point': EPS ** (1/5),
+    'richardson': EPS ** (1/5),
+    'complex': 1e-20,
+}
+
+def df(f, x, method='central', h=None):
+    """
+    數值微分 f'(x)，x 可為純量或 numpy 陣列，每個差分點只對整個陣列呼叫一次 f。
+
+    method:
+        'forward'    前向差分 O(h)
+        'central'    中央差分 O(h^2)
+        'five-point' 五點差分 O(h^4)
+        'richardson' 中央差分用 h 與 h/2 做 Richardson 外插 O(h^4)
+        'complex'    複數步長 Im f(x+ih)/h，f 必須是解析函數，沒有相減誤差
+    h: 步長，預設依 method 與 |x| 自動選擇
+    """
+    if method not in STEP:
+        raise ValueError(f"未知的差分法: {method}")
+    x = np.asarray(x, dtype=float)
+    if h is None:
+        h = STEP[method] * np.maximum(1.0, np.abs(x))
+    if method != 'complex':
+        h = (x + h) - x  # 讓 x+h 剛好可以用浮點數表示
+
+    F = lambda t: evaluate(f, t)
+    if method == 'forward':
+        r = (F(x+h) - F(x)) / h
+    elif method == 'central':
+        r = (F(x+h) - F(x-h)) / (2*h)
+    elif method == 'five-point':
+        r = (-F(x+2*h) + 8*F(x+h) - 8*F(x-h) + F(x-2*h)) / (12*h)
+    elif method == 'richardson':
+        d1 = (F(x+h) - F(x-h)) / (2*h)
+        d2 = (F(x+h/2) - F(x-h/2)) / h
+        r = d2 + (d2 - d1) / 3
+    else:
+        r = np.imag(F(x + 1j*h)) / h
+    return r if r.ndim else float(r)
+
+def integral(f, a, b, tol=1e-10):
+    return quad(f, a, b, tol=tol).value
 
 def theorem1(f, x):
-    r = df(lambda x:integral(f, 0, x), x)
+    # F 只建一次表，x 可以是整個 numpy 陣列
+    F = Antiderivative(f)
+    r = df(F, x)
+    ok = np.all(np.abs(r-f(x))<0.01)
     print('r=', r, 'f(x)=', f(x))
-    print('abs(r-f(x))<0.01 = ', abs(r-f(x))<0.01)
-    assert abs(r-f(x))<0.01
+    print('abs(r-f(x))<0.01 = ', ok)
+    assert ok
 
 def f(x):
     return x**3
 
-print('df(f, 2)=', df(f, 2))
-print('integral(f, 0, 2)=', integral(f, 0, 2))
+if __name__ == "__main__":
+    print('df(f, 2)=', df(f, 2))
+    print('integral(f, 0, 2)=', integral(f, 0, 2))
+    print('quad(f, 0, 2)=', quad(f, 0, 2))
 
-theorem1(f, 2)
\ No newline at end of file
+    theorem1(f, 2)
+    theorem1(f, np.linspace(0, 2, 5))
@@ -1,4 +1,5 @@
 import cmath
+import numpy as np
 
 def root2(a, b, c):
     D = b**2 - 4*a*c
@@ -9,5 +10,43 @@ def root2(a, b, c):
     print(a*r2**2 + b*r2 + c)
     return r1, r2
 
-print(root2(1, -3, 2))
-print(root2(1, 1, 1))
+def root2_batch(a, b, c, check=False):
+    """
+    一次解 N 個二次方程 a x^2 + b x + c = 0。
+
+    參數:
+        a, b, c: 形狀 (N,) 的係數陣列 (或純量，會自動廣播)
+        check: 為 True 時另外回傳每個根代入後的殘差 |a r^2 + b r + c|
+
+    回傳:
+        形狀 (N, 2) 的複數根陣列；check=True 時回傳 (roots, residual)
+    """
+    a, b, c = np.broadcast_arrays(*(np.atleast_1d(np.asarray(t)) for t in (a, b, c)))
+    if np.any(a == 0):
+        raise ValueError("a 不可為 0")
+
+    sqrt_D = np.sqrt((b*b - 4*a*c).astype(complex))
+    # 取和 b 同方向的平方根，避免 -b ± √D 相減造成的誤差
+    s = np.where((np.conj(b) * sqrt_D).real >= 0, 1, -1)
+    q = -(b + s*sqrt_D) / 2
+    r_big = q / a
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r_small = np.where(q == 0, 0, c / q)
+
+    # 與 root2 相同的順序：第一個根是 (-b + √D) / (2a)
+    roots = np.empty(a.shape + (2,), dtype=complex)
+    roots[:, 0] = np.where(s > 0, r_small, r_big)
+    roots[:, 1] = np.where(s > 0, r_big, r_small)
+
+    if check:
+        residual = np.abs((a[:, None]*roots + b[:, None])*roots + c[:, None])
+        return roots, residual
+    return roots
+
+if __name__ == "__main__":
+    print(root2(1, -3, 2))
+    print(root2(1, 1, 1))
+
+    roots, residual = root2_batch([1, 1, 1], [-3, 1, 1e8], [2, 1, 1], check=True)
+    print(roots)
+    print(residual.max())
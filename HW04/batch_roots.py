@@ -0,0 +1,113 @@
+"""
+大量多項式求根
+把係數列切成多個 chunk 交給 ProcessPoolExecutor，各 chunk 用由 SeedSequence 分出的獨立亂數，
+結果寫回事先配置好的陣列；單列失敗只記錄錯誤，不會中斷整批。
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from homework04 import aberth, aberth_batch
+
+
+# 每個向量化區塊的 z_j - z_k 差值表大小上限 (元素數)
+BLOCK_ELEMENTS = 2**21
+
+
+def _solve_chunk(start, rows, seed):
+    """在子行程中解一個 chunk，回傳 (start, roots, errors)。"""
+    rng = np.random.default_rng(seed)
+    n = rows.shape[1] - 1
+    roots = np.full((rows.shape[0], n), np.nan, dtype=complex)
+    errors = {}
+
+    # 係數含 inf / nan 的列直接記為失敗，不送進迭代
+    finite = np.isfinite(rows).all(axis=1)
+    errors.update({int(start + i): "ValueError: 係數含有 inf 或 nan" for i in np.flatnonzero(~finite)})
+
+    # 最高次係數非 0 的列可以整塊向量化
+    full = np.flatnonzero(finite & (rows[:, -1] != 0))
+    block = max(1, BLOCK_ELEMENTS // (n * n))
+    for b in range(0, len(full), block):
+        idx = full[b:b + block]
+        z, converged = aberth_batch(rows[idx], rng=rng)
+        ok = converged.all(axis=1) & np.isfinite(z).all(axis=1)
+        roots[idx[ok]] = z[ok]
+        errors.update({int(start + i): "RuntimeError: Aberth 法未收斂" for i in idx[~ok]})
+
+    # 次數較低的列逐列處理，少掉的根維持 nan
+    for i in np.flatnonzero(finite & (rows[:, -1] == 0)):
+        try:
+            z, converged = aberth(rows[i], rng=rng)
+            if not (converged.all() and np.isfinite(z).all()):
+                raise RuntimeError("Aberth 法未收斂")
+            roots[i, :len(z)] = z
+        except Exception as e:
+            errors[int(start + i)] = f"{type(e).__name__}: {e}"
+    return start, roots, errors
+
+
+def batch_roots(coefs, workers=None, chunk_size=256, seed=0):
+    """
+    求多個同次多項式的全部根。
+
+    參數:
+        coefs: 2 維陣列或列表，每列為一個多項式的係數 (coef[i] 為 x^i 的係數)
+        workers: 行程數，預設為 CPU 數；1 表示在目前行程中執行
+        chunk_size: 每個任務處理的列數
+        seed: 整批的亂數種子，相同種子與 chunk_size 得到相同結果
+
+    回傳:
+        (roots, errors)：roots 形狀為 (M, n) 的複數陣列，失敗的列與
+        最高次係數為 0 而少掉的根填 nan；errors 為 {列號: 錯誤訊息}
+    """
+    coefs = np.asarray(coefs, dtype=complex)
+    if coefs.ndim != 2 or coefs.shape[1] < 2:
+        raise ValueError("coefs 必須是形狀 (M, n+1) 且 n >= 1 的陣列")
+
+    M = coefs.shape[0]
+    roots = np.full((M, coefs.shape[1] - 1), np.nan, dtype=complex)
+    errors = {}
+
+    starts = range(0, M, chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    tasks = [(s, coefs[s:s + chunk_size], ss) for s, ss in zip(starts, seeds)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) == 1:
+        results = (_solve_chunk(*t) for t in tasks)
+        for start, r, e in results:
+            roots[start:start + len(r)] = r
+            errors.update(e)
+        return roots, errors
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_solve_chunk, *t) for t in tasks]
+        for (start, rows, _), future in zip(tasks, futures):
+            try:
+                _, r, e = future.result()
+            except Exception as e:
+                # 整個子行程掛掉時，這個 chunk 的每一列都記為失敗
+                msg = f"{type(e).__name__}: {e}"
+                errors.update({start + i: msg for i in range(len(rows))})
+                continue
+            roots[start:start + len(r)] = r
+            errors.update(e)
+
+    return roots, errors
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    coefs = rng.normal(size=(20000, 21))
+    coefs[5] = 0  # 故意放一列全零與一列含 inf 的係數，示範錯誤不會中斷整批
+    coefs[7, 3] = np.inf
+
+    for workers in (1, None):
+        t = time.perf_counter()
+        roots, errors = batch_roots(coefs, workers=workers)
+        print(f"workers={workers}: {time.perf_counter() - t:.2f} s, 失敗 {len(errors)} 列 {errors}")
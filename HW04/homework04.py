@@ -1,7 +1,13 @@
 import random
 import cmath
+import numpy as np
+
+from polynomial import Polynomial
 
 def poly_val(coef, x):
+    """Horner 法計算 P(x)；x 為 numpy 陣列時改用 Polynomial 一次計算所有點。"""
+    if isinstance(x, np.ndarray):
+        return Polynomial(coef)(x)
     y = 0
     for c in reversed(coef):
         y = y * x + c
@@ -11,16 +17,15 @@ def poly_derivative(coef):
     return [i * coef[i] for i in range(1, len(coef))]
 
 def newton_root(coef, max_iter=1000, tol=1e-10):
-    dcoef = poly_derivative(coef)
+    P = Polynomial(coef)
 
     x = complex(random.uniform(-1, 1), random.uniform(-1, 1))
 
     for _ in range(max_iter):
-        fx = poly_val(coef, x)
+        fx, dfx = P.evaluate(x, 1)
         if abs(fx) < tol:
             return x
 
-        dfx = poly_val(dcoef, x)
         if abs(dfx) < 1e-12:
             x += complex(random.uniform(-0.5, 0.5), random.uniform(-0.5, 0.5))
             continue
@@ -39,19 +44,130 @@ def deflate(coef, r):
 
     return new_coef
 
-def root(coef):
-    coef = coef[:]
-    roots = []
-
-    while len(coef) > 2:
-        r = newton_root(coef)
-        roots.append(r)
-        coef = deflate(coef, r)
-
-    c0, c1 = coef
-    roots.append(-c0 / c1)
+def newton_ratio(P, z):
+    """
+    回傳 P(z)/P'(z)，以及 |P(z)| 是否已小於 Horner 的捨入誤差界 (無法再改進)。
+    |z| > 1 的點改用倒序多項式 q(w) = w^n P(1/w) 計算，避免高次方溢位。
+    P 可為批次多項式，此時 z 的形狀為 (M, k)。
+    """
+    n = P.degree
+    eps4 = 4 * np.finfo(float).eps
+    inner = np.abs(z) <= 1
+
+    x = np.where(inner, z, 0)
+    p, dp = P.evaluate(x, 1)
+    p_bound = eps4 * P.magnitude()(np.abs(x))
+
+    # P(z) = z^n q(w), P'(z) = z^(n-1) (n q(w) - w q'(w))，其中 w = 1/z
+    w = np.where(inner, 0, 1 / np.where(inner, 1, z))
+    Q = P.reversed()
+    q, dq = Q.evaluate(w, 1)
+    q_bound = eps4 * Q.magnitude()(np.abs(w))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(inner, p / dp, z * q / (n * q - w * dq))
+    stop = np.where(inner, np.abs(p) <= p_bound, np.abs(q) <= q_bound)
+    return ratio, stop
+
+def initial_guess(coef, rng=None):
+    """
+    用 Newton 多邊形 (點 (i, log|c_i|) 的上凸包) 產生初始值：
+    凸包上從 i 到 j 的每一段代表 j - i 個根，其模約為 |c_i / c_j|^(1/(j-i))，
+    這正是把 Cauchy 根界套用到每一段，比只用一個外接圓收斂快得多。
+    """
+    n = len(coef) - 1
+    nz = np.flatnonzero(coef)
+    logs = np.log(np.abs(coef[nz]))
+
+    hull = []
+    for i, y in zip(nz, logs):
+        while len(hull) >= 2:
+            (i1, y1), (i2, y2) = hull[-2], hull[-1]
+            if (y2 - y1) * (i - i1) <= (y - y1) * (i2 - i1):
+                hull.pop()
+            else:
+                break
+        hull.append((i, y))
+
+    offset = 0.4 if rng is None else rng.uniform(0, 2 * np.pi)
+    z = [np.zeros(nz[0], dtype=complex)]  # c_0 = ... = c_{k-1} = 0 時有 k 個零根
+    for (i1, y1), (i2, y2) in zip(hull, hull[1:]):
+        m = i2 - i1
+        radius = np.exp((y1 - y2) / m)
+        z.append(radius * np.exp(1j * (2 * np.pi * np.arange(m) / m + offset)))
+        offset += 2 * np.pi * m / n + 0.7
+    return np.concatenate(z)
+
+def aberth_batch(coefs, max_iter=500, tol=1e-12, polish=True, rng=None):
+    """
+    Aberth–Ehrlich 法：所有根同時迭代，不做降階；M 個同次多項式一起向量化計算。
+
+    參數:
+        coefs: 形狀 (M, n+1) 的係數陣列，coefs[:, i] 為 x^i 的係數，最高次係數不可為 0
+        max_iter: 最大迭代次數
+        tol: 修正量相對於 |z| 的收斂門檻
+        polish: 迭代結束後再對原多項式做兩步牛頓法修正
+        rng: numpy Generator，用來決定初始圓上的角度偏移；None 時結果固定
+
+    回傳:
+        (roots, converged)：形狀 (M, n) 的複數根陣列與每個根是否收斂的布林陣列 (根為 inf / nan 時視為未收斂)
+    """
+    coefs = np.asarray(coefs, dtype=complex)
+    if np.any(coefs[:, -1] == 0):
+        raise ValueError("最高次係數不可為 0")
+
+    P = Polynomial(coefs)
+    z = np.stack([initial_guess(c, rng) for c in coefs])
+    n = z.shape[1]
+    diag = np.arange(n)
+
+    converged = np.zeros(z.shape, dtype=bool)
+    for _ in range(max_iter):
+        rows = np.flatnonzero(~converged.all(axis=1))
+        if rows.size == 0:
+            break
+        # 只對還有根未收斂的多項式計算
+        Pa = P if rows.size == len(coefs) else Polynomial(coefs[rows])
+        za, done = z[rows], converged[rows]
+
+        ratio, stop = newton_ratio(Pa, za)
+        diff = za[:, :, None] - za[:, None, :]
+        diff[:, diag, diag] = np.inf
+        with np.errstate(divide='ignore', invalid='ignore'):
+            w = ratio / (1 - ratio * np.sum(1 / diff, axis=2))
+        # 已收斂的根固定不動
+        w = np.where(np.isfinite(w) & ~done, w, 0)
+
+        za -= w
+        z[rows] = za
+        converged[rows] = done | stop | (np.abs(w) <= tol * np.abs(za))
+
+    if polish:
+        for _ in range(2):
+            ratio, stop = newton_ratio(P, z)
+            z = np.where(stop | ~np.isfinite(ratio), z, z - ratio)
+
+    return z, converged & np.isfinite(z)
+
+def aberth(coef, max_iter=500, tol=1e-12, polish=True, rng=None):
+    """
+    單一多項式的 Aberth–Ehrlich 法，參數同 aberth_batch。
+    coef 為係數列表，coef[i] 為 x^i 的係數 (與 poly_val 相同)。
+
+    回傳:
+        (roots, converged)：n 個根的複數陣列與每個根是否收斂的布林陣列
+    """
+    coef = np.trim_zeros(np.asarray(coef, dtype=complex), 'b')
+    if len(coef) < 2:
+        raise ValueError("多項式次數必須至少為 1")
+    z, converged = aberth_batch(coef[None], max_iter, tol, polish, rng)
+    return z[0], converged[0]
 
-    return roots
+def root(coef):
+    roots, converged = aberth(coef)
+    if not converged.all():
+        raise RuntimeError("Aberth 法未收斂")
+    return list(roots)
 
 if __name__ == "__main__":
     coef = [1, 0, 0, 0, 0, 1]  # x^5 + 1 = 0
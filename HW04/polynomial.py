@@ -0,0 +1,103 @@
+"""
+多項式物件
+係數存在連續的 numpy 陣列中，coef[..., i] 為 x^i 的係數 (與 homework04.poly_val 相同)。
+coef 為 2 維 (M, n+1) 時代表 M 個同次數的多項式，可一次批次計算。
+"""
+
+import numpy as np
+
+
+class Polynomial:
+    def __init__(self, coef):
+        coef = np.asarray(coef)
+        if coef.dtype.kind not in 'fc':
+            coef = coef.astype(float)
+        if coef.ndim not in (1, 2) or coef.shape[-1] == 0:
+            raise ValueError("係數必須是非空的 1 維或 2 維陣列")
+        self.coef = np.ascontiguousarray(coef)
+        self._derivatives = [self]
+        self._reversed = None
+        self._magnitude = None
+
+    def __repr__(self):
+        if self.coef.ndim == 2:
+            return f"Polynomial(batch={self.coef.shape[0]}, degree={self.degree})"
+        return f"Polynomial({self.coef.tolist()})"
+
+    def __len__(self):
+        return self.coef.shape[-1]
+
+    @property
+    def degree(self):
+        return self.coef.shape[-1] - 1
+
+    @property
+    def batched(self):
+        return self.coef.ndim == 2
+
+    def derivative(self, k=1):
+        """第 k 階導數，整條導數鏈只算一次並快取。"""
+        while len(self._derivatives) <= k:
+            last = self._derivatives[-1].coef
+            n = last.shape[-1]
+            if n == 1:
+                d = np.zeros_like(last)
+            else:
+                d = last[..., 1:] * np.arange(1, n)
+            self._derivatives.append(Polynomial(d))
+        return self._derivatives[k]
+
+    def reversed(self):
+        """倒序多項式 x^n P(1/x)。"""
+        if self._reversed is None:
+            self._reversed = Polynomial(self.coef[..., ::-1])
+        return self._reversed
+
+    def magnitude(self):
+        """係數取絕對值的多項式，用來估計 Horner 的捨入誤差界。"""
+        if self._magnitude is None:
+            self._magnitude = Polynomial(np.abs(self.coef))
+        return self._magnitude
+
+    def _columns(self, x):
+        """批次模式下把第 i 個係數排成可與 x 廣播的形狀 (M, 1, ...)。"""
+        if not self.batched:
+            return self.coef
+        x = np.asarray(x)
+        if x.ndim == 0 or x.shape[0] not in (1, self.coef.shape[0]):
+            raise ValueError("批次模式下 x 的第 0 維必須是 1 或多項式個數 M")
+        return self.coef.T.reshape((len(self), self.coef.shape[0]) + (1,) * (x.ndim - 1))
+
+    def evaluate(self, x, nderiv=0):
+        """
+        一次 Horner 掃描同時算出 P(x), P'(x), ..., P^(nderiv)(x)。
+
+        參數:
+            x: 純量或 numpy 陣列 (可為複數)；批次模式下形狀為 (M, ...) 或 (1, ...)
+            nderiv: 要一起計算的導數階數
+
+        回傳:
+            長度 nderiv + 1 的 list
+        """
+        cols = self._columns(x) if self.batched else self.coef
+        x = np.asarray(x)
+        n = len(self)
+
+        shape = np.broadcast_shapes(x.shape, np.shape(cols[0]))
+        dtype = np.result_type(x, cols)
+        out = [np.zeros(shape, dtype=dtype) for _ in range(nderiv + 1)]
+        out[0] += cols[n - 1]
+        for i in range(n - 2, -1, -1):
+            for k in range(min(nderiv, n - 1 - i), 0, -1):
+                out[k] = out[k] * x + out[k - 1]
+            out[0] = out[0] * x + cols[i]
+
+        # Horner 累積的是 P^(k)/k!
+        factorial = 1
+        for k in range(2, nderiv + 1):
+            factorial *= k
+            out[k] = out[k] * factorial
+        return [r if r.ndim else r[()] for r in out]
+
+    def __call__(self, x):
+        return self.evaluate(x)[0]
@@ -0,0 +1,366 @@
+"""
+陣列版有限體 GF(p)
+homework05.md 的 FiniteFieldElement 每個元素都是一個物件；
+這裡改成把整個向量 / 矩陣的值存在 numpy 整數陣列中，運算一次對整個陣列取 mod p。
+"""
+
+import numpy as np
+
+
+class Field:
+    """
+    有限體的共同介面：元素以 0 ~ order-1 的整數表示，子類別實作
+    add / neg / mul / inv，矩陣乘法與高斯消去法由這裡用這些運算組合而成。
+    """
+
+    order = None
+
+    def sub(self, a, b):
+        return self.add(a, self.neg(b))
+
+    def div(self, a, b):
+        return self.mul(a, self.inv(b))
+
+    def power(self, a, e):
+        """a^e，用平方乘法對整個陣列同時計算；e 為整數。"""
+        a = np.asarray(a, dtype=np.int64)
+        if e < 0:
+            a, e = self.inv(a), -e
+        result = np.ones_like(a)
+        while e:
+            if e & 1:
+                result = self.mul(result, a)
+            a = self.mul(a, a)
+            e >>= 1
+        return result
+
+    def matmul(self, A, B):
+        """一般體上的矩陣乘法：對內積維度逐項累加。"""
+        C = np.zeros((A.shape[0], B.shape[1]), dtype=np.int64)
+        for k in range(A.shape[1]):
+            C = self.add(C, self.mul(A[:, k, None], B[None, k, :]))
+        return C
+
+    def row_reduce(self, A, ncols=None):
+        """
+        高斯–喬登消去法，回傳 (簡化列梯形矩陣, 主元欄位)。
+        ncols 限制只在前 ncols 欄找主元 (用於增廣矩陣)。
+        """
+        A = np.array(A, dtype=np.int64)
+        rows, cols = A.shape
+        ncols = cols if ncols is None else ncols
+        pivots = []
+        r = 0
+        for c in range(ncols):
+            if r == rows:
+                break
+            nz = np.flatnonzero(A[r:, c])
+            if nz.size == 0:
+                continue
+            i = r + nz[0]
+            if i != r:
+                A[[r, i]] = A[[i, r]]
+
+            A[r, c:] = self.mul(A[r, c:], self.inv(A[r, c]))
+            # 一次消去其他所有列的第 c 欄
+            factor = A[:, c, None].copy()
+            factor[r] = 0
+            A[:, c:] = self.sub(A[:, c:], self.mul(factor, A[r, c:]))
+
+            pivots.append(c)
+            r += 1
+        return A, pivots
+
+    def echelon(self, A, block=64):
+        """
+        分塊高斯消去法，把 A 化為列梯形 (不做回代)，回傳 (U, 主元欄位)。
+        每個寬度 block 的欄面板先逐欄消去並記錄乘數，
+        右邊剩下的欄再用一次矩陣乘法 A22 -= L21 @ U12 更新，讓大部分運算落在 matmul 上。
+        """
+        A = np.array(A, dtype=np.int64)
+        rows, cols = A.shape
+        pivots = []
+        r = 0
+        for c0 in range(0, cols, block):
+            if r == rows:
+                break
+            c1 = min(c0 + block, cols)
+            r0 = r
+            M = np.zeros((rows - r0, c1 - c0), dtype=np.int64)  # 乘數，第 t 欄對應面板中第 t 個主元
+
+            for c in range(c0, c1):
+                if r == rows:
+                    break
+                nz = np.flatnonzero(A[r:, c])
+                if nz.size == 0:
+                    continue
+                i = r + nz[0]
+                if i != r:
+                    A[[r, i]] = A[[i, r]]
+                    M[[r - r0, i - r0]] = M[[i - r0, r - r0]]
+
+                t = r - r0
+                m = self.mul(A[r + 1:, c], self.inv(A[r, c]))
+                M[t + 1:, t] = m
+                A[r + 1:, c:c1] = self.sub(A[r + 1:, c:c1], self.mul(m[:, None], A[r, c:c1]))
+                pivots.append(c)
+                r += 1
+
+            k = r - r0
+            if k and c1 < cols:
+                # U12 = L11^-1 A12 (前代)，再更新 A22
+                U12 = A[r0:r, c1:]
+                for t in range(1, k):
+                    U12[t] = self.sub(U12[t], self.matmul(M[t:t + 1, :t], U12[:t])[0])
+                A[r:, c1:] = self.sub(A[r:, c1:], self.matmul(M[k:, :k], U12))
+        return A, pivots
+
+    def rank(self, A):
+        return len(self.echelon(A)[1])
+
+    def solve(self, A, b):
+        """解方陣 A x = b；b 可為向量或多個右手邊組成的矩陣。"""
+        A = np.asarray(A, dtype=np.int64)
+        b = np.asarray(b, dtype=np.int64)
+        n = A.shape[0]
+        if A.ndim != 2 or A.shape[1] != n:
+            raise ValueError("A must be a square matrix")
+        vector = b.ndim == 1
+
+        U, pivots = self.echelon(np.hstack([A, b.reshape(n, -1)]))
+        if pivots[:n] != list(range(n)):
+            raise ValueError("matrix is singular")
+
+        # 回代
+        y = U[:, n:]
+        x = np.zeros_like(y)
+        for t in range(n - 1, -1, -1):
+            rhs = self.sub(y[t], self.matmul(U[t:t + 1, t + 1:n], x[t + 1:])[0])
+            x[t] = self.mul(rhs, self.inv(U[t, t]))
+        return x[:, 0] if vector else x
+
+    def inv_matrix(self, A):
+        n = np.shape(A)[0]
+        return self.solve(A, np.eye(n, dtype=np.int64))
+
+
+class PrimeField(Field):
+    def __init__(self, p):
+        if p <= 1 or any(p % d == 0 for d in range(2, int(p**0.5) + 1)):
+            raise ValueError("p must be a prime")
+        if p >= 2**31:
+            raise ValueError("p must be less than 2**31")
+        self.p = p
+        self.order = p
+        # p 不大時預先算好所有元素的乘法反元素
+        self._inv_table = None
+        if p <= 2**20:
+            self._inv_table = np.zeros(p, dtype=np.int64)
+            self._inv_table[1:] = _inverse_mod(np.arange(1, p, dtype=np.int64), p)
+
+    def __repr__(self):
+        return f"GF({self.p})"
+
+    def add(self, a, b):
+        return (np.asarray(a, dtype=np.int64) + b) % self.p
+
+    def neg(self, a):
+        return (-np.asarray(a, dtype=np.int64)) % self.p
+
+    def sub(self, a, b):
+        return (np.asarray(a, dtype=np.int64) - b) % self.p
+
+    def mul(self, a, b):
+        # p < 2^31，乘積不會超過 int64
+        return (np.asarray(a, dtype=np.int64) * b) % self.p
+
+    def inv(self, a):
+        a = np.asarray(a, dtype=np.int64)
+        if np.any(a == 0):
+            raise ZeroDivisionError("0 has no multiplicative inverse")
+        if self._inv_table is not None:
+            return self._inv_table[a]
+        return _inverse_mod(a, self.p)
+
+    def matmul(self, A, B):
+        """
+        累加前不取 mod 的部分和只要不超過浮點數能精確表示的 2^53，就可以直接用 BLAS；
+        否則依內積維度分段，每段在 int64 範圍內累加後取 mod。
+        """
+        k = A.shape[1]
+        bound = (self.p - 1) ** 2
+        if bound * k < 2**53:
+            C = A.astype(np.float64) @ B.astype(np.float64)
+            return C.astype(np.int64) % self.p
+
+        step = max(1, (2**63 - 1) // bound - 1)
+        C = np.zeros((A.shape[0], B.shape[1]), dtype=np.int64)
+        for s in range(0, k, step):
+            C = (C + A[:, s:s + step] @ B[s:s + step]) % self.p
+        return C
+
+
+def _inverse_mod(a, p):
+    """批次擴展歐幾里得法，對整個陣列同時求 a^-1 mod p。"""
+    r0, r1 = np.full_like(a, p), a % p
+    t0, t1 = np.zeros_like(a), np.ones_like(a)
+    while np.any(r1):
+        active = r1 != 0
+        q = np.where(active, r0 // np.where(active, r1, 1), 0)
+        r0, r1 = np.where(active, r1, r0), np.where(active, r0 - q * r1, r1)
+        t0, t1 = np.where(active, t1, t0), np.where(active, t0 - q * t1, t1)
+    return t0 % p
+
+
+_fields = {}
+
+
+def GF(p, n=1, modulus=None):
+    """
+    取得 GF(p) 或擴張體 GF(p^n)，相同參數共用同一個體物件 (與反元素表、log / exp 表)。
+    modulus 為 GF(p^n) 的不可約多項式，見 gf_extension.ExtensionField。
+    """
+    key = (p, n, tuple(modulus) if isinstance(modulus, (list, tuple)) else modulus)
+    if key not in _fields:
+        if n == 1 and modulus is None:
+            _fields[key] = PrimeField(p)
+        else:
+            from gf_extension import ExtensionField
+            _fields[key] = ExtensionField(p, n, modulus)
+    return _fields[key]
+
+
+class GFArray:
+    """
+    GF(p) (或 GF(p^n)) 上的向量 / 矩陣，值存在 int64 陣列中。
+    可與同一個體的 GFArray 或一般整數做 + - * /，@ 為矩陣乘法。
+    """
+
+    def __init__(self, values, field):
+        if isinstance(field, int):
+            field = GF(field)
+        self.field = field
+        values = np.asarray(values)
+        if values.dtype.kind not in 'iub':
+            raise TypeError("values must be integers")
+        self.values = values.astype(np.int64) % field.order
+
+    def __repr__(self):
+        return f"{self.field}[{self.values.tolist()}]"
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    @property
+    def T(self):
+        return GFArray._wrap(self.values.T, self.field)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        return GFArray._wrap(self.values[index], self.field)
+
+    def __setitem__(self, index, value):
+        self.values[index] = self._operand(value)
+
+    def __eq__(self, other):
+        return self.values == self._operand(other)
+
+    def __array__(self, dtype=None, copy=None):
+        return self.values if dtype is None else self.values.astype(dtype)
+
+    @staticmethod
+    def _wrap(values, field):
+        obj = GFArray.__new__(GFArray)
+        obj.field = field
+        obj.values = values
+        return obj
+
+    def _operand(self, other):
+        if isinstance(other, GFArray):
+            if other.field is not self.field:
+                raise TypeError("Operands must be in the same finite field")
+            return other.values
+        return np.asarray(other, dtype=np.int64) % self.field.order
+
+    # 加法
+    def __add__(self, other):
+        return GFArray._wrap(self.field.add(self.values, self._operand(other)), self.field)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return GFArray._wrap(self.field.neg(self.values), self.field)
+
+    def __sub__(self, other):
+        return GFArray._wrap(self.field.sub(self.values, self._operand(other)), self.field)
+
+    def __rsub__(self, other):
+        return GFArray._wrap(self.field.sub(self._operand(other), self.values), self.field)
+
+    # 乘法
+    def __mul__(self, other):
+        return GFArray._wrap(self.field.mul(self.values, self._operand(other)), self.field)
+
+    __rmul__ = __mul__
+
+    def inv(self):
+        return GFArray._wrap(self.field.inv(self.values), self.field)
+
+    def __truediv__(self, other):
+        return GFArray._wrap(self.field.div(self.values, self._operand(other)), self.field)
+
+    def __rtruediv__(self, other):
+        return GFArray._wrap(self.field.div(self._operand(other), self.values), self.field)
+
+    def __pow__(self, e):
+        return GFArray._wrap(self.field.power(self.values, int(e)), self.field)
+
+    def __matmul__(self, other):
+        other = self._operand(other)
+        A, B = np.atleast_2d(self.values), other.reshape(other.shape[0], -1)
+        C = self.field.matmul(A, B)
+        if self.values.ndim == 1:
+            C = C[0]
+        if other.ndim == 1:
+            C = C[..., 0]
+        return GFArray._wrap(C, self.field)
+
+    # 線性代數
+    def row_reduce(self):
+        R, pivots = self.field.row_reduce(self.values)
+        return GFArray._wrap(R, self.field), pivots
+
+    def rank(self):
+        return self.field.rank(self.values)
+
+    def solve(self, b):
+        return GFArray._wrap(self.field.solve(self.values, self._operand(b)), self.field)
+
+    def inv_matrix(self):
+        return GFArray._wrap(self.field.inv_matrix(self.values), self.field)
+
+
+if __name__ == "__main__":
+    import time
+
+    a = GFArray([3, 6, 2], 7)
+    b = GFArray([5, 1, 4], 7)
+
+    print(a + b)      # GF(7)[[1, 0, 6]]
+    print(a * b)      # GF(7)[[1, 6, 1]]
+    print(a - b)      # GF(7)[[5, 5, 5]]
+    print(a / b)      # GF(7)[[2, 6, 4]]
+
+    p = 65521
+    n = 1000
+    rng = np.random.default_rng(0)
+    A = GFArray(rng.integers(0, p, size=(n, n)), p)
+    x = GFArray(rng.integers(0, p, size=n), p)
+
+    t = time.perf_counter()
+    y = A.solve(A @ x)
+    print(f"GF({p}) 上解 {n}x{n} 線性方程組: {time.perf_counter() - t:.2f} s, 正確: {bool(np.all(y == x))}")
+    print("rank:", A.rank())
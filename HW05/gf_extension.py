@@ -0,0 +1,248 @@
+"""
+擴張體 GF(p^n)
+元素用 0 ~ p^n-1 的整數表示，其 p 進位的第 i 位數就是多項式 x^i 項的係數。
+每個體只在第一次建立時找出生成元並建好 log / exp 表 (依 (p, n, 模多項式) 快取共用)，
+之後乘法、除法、次方都只是查表，可以對整個陣列一起算。
+"""
+
+import numpy as np
+
+from gf_array import Field
+
+# 表格大小上限，超過就不適合查表
+MAX_ORDER = 2**20
+
+
+# ------------------- GF(p) 上的多項式 (係數列表，由低次到高次) -------------------
+def _trim(a):
+    while len(a) > 1 and a[-1] == 0:
+        a = a[:-1]
+    return a
+
+
+def _poly_mod(a, f, p):
+    a = [c % p for c in a]
+    inv_lead = pow(f[-1], p - 2, p)
+    while len(a) >= len(f):
+        q = a[-1] * inv_lead % p
+        if q:
+            shift = len(a) - len(f)
+            for i, c in enumerate(f):
+                a[shift + i] = (a[shift + i] - q * c) % p
+        a.pop()
+    return _trim(a) or [0]
+
+
+def _poly_mulmod(a, b, f, p):
+    r = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                r[i + j] += x * y
+    return _poly_mod(r, f, p)
+
+
+def _poly_powmod(a, e, f, p):
+    result = [1]
+    while e:
+        if e & 1:
+            result = _poly_mulmod(result, a, f, p)
+        a = _poly_mulmod(a, a, f, p)
+        e >>= 1
+    return result
+
+
+def _poly_gcd(a, b, p):
+    a, b = _trim(a), _trim(b)
+    while any(b):
+        a, b = b, _poly_mod(a, b, p)
+    return a
+
+
+def is_irreducible(f, p):
+    """Rabin 判別法：f 沒有次數 <= n/2 的因式 ⇔ 對 k <= n/2，gcd(x^(p^k) - x, f) = 1。"""
+    n = len(f) - 1
+    h = [0, 1]
+    for _ in range(n // 2):
+        h = _poly_powmod(h, p, f, p)
+        d = list(h) + [0] * max(0, 2 - len(h))
+        d[1] -= 1
+        if len(_poly_gcd(f, d, p)) > 1:
+            return False
+    return True
+
+
+def _prime_factors(m):
+    factors, d = [], 2
+    while d * d <= m:
+        if m % d == 0:
+            factors.append(d)
+            while m % d == 0:
+                m //= d
+        d += 1
+    if m > 1:
+        factors.append(m)
+    return factors
+
+
+def _is_primitive(g, f, p, q):
+    """g 在 GF(p)[x]/f 中的階是否為 q - 1。"""
+    return all(_poly_powmod(g, (q - 1) // r, f, p) != [1] for r in _prime_factors(q - 1))
+
+
+def _digits(k, p, n):
+    return [(k // p**i) % p for i in range(n)]
+
+
+def find_primitive_polynomial(p, n):
+    """依字典序找出第一個次數 n 的首一本原多項式 (x 本身就是生成元)。"""
+    q = p**n
+    for k in range(1, q):
+        f = _digits(k, p, n) + [1]
+        if f[0] and is_irreducible(f, p) and _is_primitive([0, 1], f, p, q):
+            return f
+    raise ValueError(f"找不到 GF({p}^{n}) 的本原多項式")
+
+
+def _digits_padded(a, n):
+    return list(a) + [0] * (n - len(a))
+
+
+# ------------------- 擴張體 -------------------
+_tables = {}
+
+
+def _build_tables(p, n, modulus):
+    """回傳 (生成元, exp 表, log 表)；exp 表長度 2(q-1)，乘法時 log 相加不必再取 mod。"""
+    q = p**n
+    g = None
+    for k in range(p, q):
+        cand = _trim(_digits(k, p, n))
+        if _is_primitive(cand, modulus, p, q):
+            g = k
+            break
+    if g is None:
+        raise ValueError("modulus must be irreducible")
+
+    # 乘以 g 是 GF(p)^n 上的線性映射，先算好矩陣再反覆套用
+    gpoly = _digits(g, p, n)
+    M = np.array([_digits_padded(_poly_mulmod(gpoly, [0] * j + [1], modulus, p), n) for j in range(n)]).T
+    place = p ** np.arange(n)
+
+    exp = np.empty(2 * (q - 1), dtype=np.int64)
+    v = np.zeros(n, dtype=np.int64)
+    v[0] = 1
+    for k in range(q - 1):
+        exp[k] = v @ place
+        v = (M @ v) % p
+    exp[q - 1:] = exp[:q - 1]
+
+    log = np.zeros(q, dtype=np.int64)
+    log[exp[:q - 1]] = np.arange(q - 1)
+    return g, exp, log
+
+
+class ExtensionField(Field):
+    def __init__(self, p, n, modulus=None):
+        """
+        參數:
+            p: 質數
+            n: 擴張次數
+            modulus: 次數 n 的不可約多項式係數 (由低次到高次)，或用整數編碼 (如 AES 的 0x11B)；
+                     None 時自動找本原多項式
+        """
+        if p <= 1 or any(p % d == 0 for d in range(2, int(p**0.5) + 1)):
+            raise ValueError("p must be a prime")
+        q = p**n
+        if q > MAX_ORDER:
+            raise ValueError(f"field order must be at most {MAX_ORDER}")
+
+        if modulus is None:
+            modulus = find_primitive_polynomial(p, n)
+        elif isinstance(modulus, int):
+            modulus = _digits(modulus, p, n + 1)
+        modulus = [c % p for c in modulus]
+        if len(modulus) != n + 1 or modulus[-1] == 0:
+            raise ValueError(f"modulus must have degree {n}")
+        if not is_irreducible(modulus, p):
+            raise ValueError("modulus must be irreducible")
+
+        self.p, self.n, self.order = p, n, q
+        self.modulus = tuple(modulus)
+
+        key = (p, n, self.modulus)
+        if key not in _tables:
+            _tables[key] = _build_tables(p, n, modulus)
+        self.generator, self.exp, self.log = _tables[key]
+
+    def __repr__(self):
+        return f"GF({self.p}^{self.n})"
+
+    def _digitwise(self, a, b, sign):
+        """逐位數做 mod p 加減 (多項式係數相加)。"""
+        a = np.asarray(a, dtype=np.int64)
+        b = np.asarray(b, dtype=np.int64)
+        if self.p == 2:
+            return a ^ b
+        result = np.zeros(np.broadcast_shapes(a.shape, b.shape), dtype=np.int64)
+        place = 1
+        for _ in range(self.n):
+            result += ((a % self.p + sign * (b % self.p)) % self.p) * place
+            a, b = a // self.p, b // self.p
+            place *= self.p
+        return result
+
+    def add(self, a, b):
+        return self._digitwise(a, b, 1)
+
+    def sub(self, a, b):
+        return self._digitwise(a, b, -1)
+
+    def neg(self, a):
+        return self._digitwise(0, a, -1)
+
+    def mul(self, a, b):
+        a = np.asarray(a, dtype=np.int64)
+        b = np.asarray(b, dtype=np.int64)
+        return np.where((a == 0) | (b == 0), 0, self.exp[self.log[a] + self.log[b]])
+
+    def inv(self, a):
+        a = np.asarray(a, dtype=np.int64)
+        if np.any(a == 0):
+            raise ZeroDivisionError("0 has no multiplicative inverse")
+        return self.exp[(self.order - 1) - self.log[a]]
+
+    def div(self, a, b):
+        a = np.asarray(a, dtype=np.int64)
+        b = np.asarray(b, dtype=np.int64)
+        if np.any(b == 0):
+            raise ZeroDivisionError("0 has no multiplicative inverse")
+        return np.where(a == 0, 0, self.exp[self.log[a] - self.log[b] + (self.order - 1)])
+
+    def power(self, a, e):
+        a = np.asarray(a, dtype=np.int64)
+        if e < 0 and np.any(a == 0):
+            raise ZeroDivisionError("0 has no multiplicative inverse")
+        if e == 0:
+            return np.ones_like(a)
+        k = (self.log[a] * (e % (self.order - 1))) % (self.order - 1)
+        return np.where(a == 0, 0, self.exp[k])
+
+
+if __name__ == "__main__":
+    from gf_array import GF, GFArray
+
+    F = GF(2, 8)
+    print(F, "模多項式:", F.modulus, "生成元:", F.generator)
+
+    # AES 使用的 GF(2^8)：x^8 + x^4 + x^3 + x + 1
+    aes = GF(2, 8, modulus=0x11B)
+    a = GFArray([0x57, 0x53, 0x02], aes)
+    b = GFArray([0x83, 0xCA, 0x87], aes)
+    print(aes, "生成元:", aes.generator)
+    print("a * b =", [hex(v) for v in (a * b).values])   # 0x57 * 0x83 = 0xc1，0x53 * 0xca = 0x01
+    print("a / b * b == a:", bool(np.all(a / b * b == a)))
+
+    G = GF(3, 4)
+    x = GFArray(np.arange(1, 81), G)
+    print(G, "x^80 == 1:", bool(np.all(x**80 == 1)), "共用表格:", GF(3, 4).exp is G.exp)
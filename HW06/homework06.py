@@ -1,6 +1,9 @@
 import math
+import numpy as np
 # ------------------- 點 -------------------
 class Point:
+    __slots__ = ("x", "y")
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -15,10 +18,19 @@ class Point:
         return Point(self.x * factor, self.y * factor)
 
     def rotate(self, degree):
-        rad = math.radians(degree)
-        x_new = self.x * math.cos(rad) - self.y * math.sin(rad)
-        y_new = self.x * math.sin(rad) + self.y * math.cos(rad)
+        return self._rotate(*_cos_sin(degree))
+
+    def _rotate(self, cos, sin):
+        x_new = self.x * cos - self.y * sin
+        y_new = self.x * sin + self.y * cos
         return Point(x_new, y_new)
+
+    def transform(self, t):
+        return Point(*t.apply_point(self.x, self.y))
+
+def _cos_sin(degree):
+    rad = math.radians(degree)
+    return math.cos(rad), math.sin(rad)
 # ------------------- 直線 -------------------
 class Line:
     def __init__(self, p1: Point, p2: Point):
@@ -130,34 +142,293 @@ class Circle:
             return [p1, p2]
 # ------------------- 三角形 -------------------
 class Triangle:
+    """
+    三角形的變換是惰性的：translate / scale / rotate 只把操作合併進待套用的 Transform，
+    讀取 p1 / p2 / p3 時才一次算出頂點座標。
+    有待套用的變換時 _points 存的是頂點座標的複本 (x, y)，之後修改原本的 Point 不會影響結果。
+    """
+    __slots__ = ("_points", "_transform")
+
     def __init__(self, p1: Point, p2: Point, p3: Point):
-        self.p1, self.p2, self.p3 = p1, p2, p3
+        self._points = (p1, p2, p3)
+        self._transform = None
 
     def __repr__(self):
         return f"Triangle({self.p1}, {self.p2}, {self.p3})"
 
+    def _materialize(self):
+        if self._transform is not None:
+            self._points = tuple(Point(*self._transform.apply_point(x, y)) for x, y in self._points)
+            self._transform = None
+        return self._points
+
+    @property
+    def p1(self):
+        return self._materialize()[0]
+
+    @property
+    def p2(self):
+        return self._materialize()[1]
+
+    @property
+    def p3(self):
+        return self._materialize()[2]
+
+    @property
+    def pending(self):
+        """尚未套用的變換 (沒有時為恆等變換)。"""
+        return self._transform or Transform()
+
+    def transform(self, t):
+        tri = Triangle.__new__(Triangle)
+        tri._points = self._points if self._transform is not None else tuple((p.x, p.y) for p in self._points)
+        tri._transform = self.pending.then(t)
+        return tri
+
+    def translate(self, dx, dy):
+        return self.transform(Transform.translation(dx, dy))
+
+    def scale(self, factor):
+        return self.transform(Transform.scaling(factor))
+
+    def rotate(self, degree):
+        return self.transform(Transform.rotation(degree))
+# ------------------- 仿射矩陣 -------------------
+# 齊次座標 (x, y, 1) 的 3x3 矩陣，平移也能寫成矩陣乘法
+def translation_matrix(dx, dy):
+    return np.array([[1.0, 0.0, dx],
+                     [0.0, 1.0, dy],
+                     [0.0, 0.0, 1.0]])
+
+def scale_matrix(factor):
+    return np.array([[factor, 0.0, 0.0],
+                     [0.0, factor, 0.0],
+                     [0.0, 0.0, 1.0]])
+
+def rotation_matrix(degree):
+    cos, sin = _cos_sin(degree)
+    return np.array([[cos, -sin, 0.0],
+                     [sin, cos, 0.0],
+                     [0.0, 0.0, 1.0]])
+
+def apply_matrix(coords, M, out=None):
+    """對最後一維為 (x, y) 的座標陣列套用 2x2 或 3x3 矩陣，out 可為 coords 本身 (原地計算)。"""
+    M = np.asarray(M, dtype=float)
+    if out is None:
+        out = np.empty_like(coords)
+    np.matmul(coords, M[:2, :2].T, out=out)
+    if M.shape == (3, 3):
+        out += M[:2, 2]
+    return out
+
+class Transform:
+    """
+    記錄一串平移 / 縮放 / 旋轉並合併成一個仿射變換：
+    x' = a*x + b*y + c
+    y' = d*x + e*y + f
+    用 6 個浮點數而不是 numpy 矩陣，合併一步只要十幾次乘法。
+    """
+    __slots__ = ("a", "b", "c", "d", "e", "f")
+
+    def __init__(self, a=1.0, b=0.0, c=0.0, d=0.0, e=1.0, f=0.0):
+        self.a, self.b, self.c = a, b, c
+        self.d, self.e, self.f = d, e, f
+
+    def __repr__(self):
+        return f"Transform([[{self.a}, {self.b}, {self.c}], [{self.d}, {self.e}, {self.f}]])"
+
+    @classmethod
+    def translation(cls, dx, dy):
+        return cls(c=dx, f=dy)
+
+    @classmethod
+    def scaling(cls, factor):
+        return cls(a=factor, e=factor)
+
+    @classmethod
+    def rotation(cls, degree):
+        cos, sin = _cos_sin(degree)
+        return cls(cos, -sin, 0.0, sin, cos, 0.0)
+
+    @classmethod
+    def from_matrix(cls, M):
+        M = np.asarray(M, dtype=float)
+        c, f = (M[0, 2], M[1, 2]) if M.shape == (3, 3) else (0.0, 0.0)
+        return cls(M[0, 0], M[0, 1], c, M[1, 0], M[1, 1], f)
+
+    @property
+    def matrix(self):
+        return np.array([[self.a, self.b, self.c],
+                         [self.d, self.e, self.f],
+                         [0.0, 0.0, 1.0]])
+
+    def then(self, other):
+        """先做 self 再做 other 的合成變換。"""
+        o = other
+        return Transform(o.a*self.a + o.b*self.d, o.a*self.b + o.b*self.e, o.a*self.c + o.b*self.f + o.c,
+                         o.d*self.a + o.e*self.d, o.d*self.b + o.e*self.e, o.d*self.c + o.e*self.f + o.f)
+
     def translate(self, dx, dy):
-        return Triangle(self.p1.translate(dx, dy),
-                        self.p2.translate(dx, dy),
-                        self.p3.translate(dx, dy))
+        return self.then(Transform.translation(dx, dy))
 
     def scale(self, factor):
-        return Triangle(self.p1.scale(factor),
-                        self.p2.scale(factor),
-                        self.p3.scale(factor))
+        return self.then(Transform.scaling(factor))
 
     def rotate(self, degree):
-        return Triangle(self.p1.rotate(degree),
-                        self.p2.rotate(degree),
-                        self.p3.rotate(degree))
-line = Line(Point(0, 0), Point(10, 0))
-pt = Point(3, 4)
-foot = line.perpendicular_from_point(pt)
-
-# 計算三角形三邊長
-a = math.hypot(pt.x - foot.x, pt.y - foot.y) 
-b = math.hypot(foot.x - 0, foot.y - 0) 
-c = math.hypot(pt.x - 0, pt.y - 0) 
-
-print("三角形邊長:", a, b, c)
-print("驗證畢氏定理:", math.isclose(a**2 + b**2, c**2))
+        return self.then(Transform.rotation(degree))
+
+    def apply_point(self, x, y):
+        return self.a*x + self.b*y + self.c, self.d*x + self.e*y + self.f
+
+    def apply(self, coords, out=None):
+        return apply_matrix(coords, self.matrix, out)
+
+def _as_transform(t):
+    return t if isinstance(t, Transform) else Transform.from_matrix(t)
+
+# ------------------- 點陣列 -------------------
+class _LazyCoords:
+    """
+    座標陣列的共同部分：translate / scale / rotate 不帶 out 時只合併 Transform，
+    讀取 coords 時才一次套用；帶 out 時立即寫入 out (可為自己，原地計算)。
+    惰性結果、切片與 points 會和來源共用同一塊 _base，兩邊都標記為 _shared；
+    對共用的陣列原地寫入時先換成新的緩衝區 (copy-on-write)，不會改到其他陣列。
+    """
+    __slots__ = ("_base", "_transform", "_shared")
+
+    def _init(self, coords, shape):
+        coords = np.ascontiguousarray(coords, dtype=float)
+        if coords.ndim != len(shape) or coords.shape[1:] != shape[1:]:
+            raise ValueError(f"coords 的形狀必須是 {shape}")
+        self._base = coords
+        self._transform = None
+        self._shared = False
+
+    def _share(self, other):
+        """other 與 self 共用緩衝區。"""
+        self._shared = other._shared = True
+        return other
+
+    @property
+    def coords(self):
+        if self._transform is not None:
+            self._base = self._transform.apply(self._base)
+            self._transform = None
+            self._shared = False
+        return self._base
+
+    @property
+    def pending(self):
+        """尚未套用的變換 (沒有時為恆等變換)。"""
+        return self._transform or Transform()
+
+    def __len__(self):
+        return self._base.shape[0]
+
+    def transform(self, t, out=None):
+        t = _as_transform(t)
+        if out is None:
+            lazy = type(self).__new__(type(self))
+            lazy._base = self._base
+            lazy._transform = self.pending.then(t)
+            return self._share(lazy)
+        src = self.coords
+        if not isinstance(out, _LazyCoords):
+            return type(self)(t.apply(src, out))
+        if out._shared or out._transform is not None:
+            # 緩衝區還被其他陣列使用 (或內容即將被覆蓋)，寫到新的緩衝區
+            target = np.empty_like(out._base)
+        else:
+            target = out._base
+        out._base = t.apply(src, target)
+        out._transform = None
+        out._shared = False
+        return out
+
+    def translate(self, dx, dy, out=None):
+        return self.transform(Transform.translation(dx, dy), out)
+
+    def scale(self, factor, out=None):
+        return self.transform(Transform.scaling(factor), out)
+
+    def rotate(self, degree, out=None):
+        return self.transform(Transform.rotation(degree), out)
+
+class PointArray(_LazyCoords):
+    """N 個點存成連續的 (N, 2) 陣列，變換一次對所有點做一個矩陣乘法。"""
+    __slots__ = ()
+
+    def __init__(self, coords):
+        self._init(coords, ("N", 2))
+
+    @classmethod
+    def from_points(cls, points):
+        return cls([(p.x, p.y) for p in points])
+
+    def __repr__(self):
+        return f"PointArray(n={len(self)})"
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            x, y = self.coords[index]
+            return Point(float(x), float(y))
+        return self._share(PointArray(self.coords[index]))
+
+    @property
+    def x(self):
+        return self.coords[:, 0]
+
+    @property
+    def y(self):
+        return self.coords[:, 1]
+# ------------------- 三角形陣列 -------------------
+class TriangleArray(_LazyCoords):
+    """N 個三角形存成連續的 (N, 3, 2) 陣列。"""
+    __slots__ = ()
+
+    def __init__(self, coords):
+        self._init(coords, ("N", 3, 2))
+
+    @classmethod
+    def from_triangles(cls, triangles):
+        return cls([[(p.x, p.y) for p in (t.p1, t.p2, t.p3)] for t in triangles])
+
+    def __repr__(self):
+        return f"TriangleArray(n={len(self)})"
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Triangle(*(Point(float(x), float(y)) for x, y in self.coords[index]))
+        return self._share(TriangleArray(self.coords[index]))
+
+    @property
+    def points(self):
+        """所有頂點的 PointArray (與本陣列共用記憶體，原地寫入時會先複製)。"""
+        return self._share(PointArray(self.coords.reshape(-1, 2)))
+
+if __name__ == "__main__":
+    line = Line(Point(0, 0), Point(10, 0))
+    pt = Point(3, 4)
+    foot = line.perpendicular_from_point(pt)
+
+    # 計算三角形三邊長
+    a = math.hypot(pt.x - foot.x, pt.y - foot.y) 
+    b = math.hypot(foot.x - 0, foot.y - 0) 
+    c = math.hypot(pt.x - 0, pt.y - 0) 
+
+    print("三角形邊長:", a, b, c)
+    print("驗證畢氏定理:", math.isclose(a**2 + b**2, c**2))
+
+    # 一百萬個三角形一起旋轉 (原地計算)
+    import time
+    mesh = TriangleArray(np.random.default_rng(0).random((1_000_000, 3, 2)))
+    t = time.perf_counter()
+    mesh.rotate(30, out=mesh)
+    print(f"旋轉 {len(mesh)} 個三角形: {time.perf_counter() - t:.3f} s")
+
+    # 惰性串接：三個操作合併成一個 Transform，讀取 coords 時才走過一次資料
+    t = time.perf_counter()
+    moved = mesh.translate(1, 2).rotate(45).scale(0.5)
+    print("合併後的變換:", moved.pending)
+    coords = moved.coords
+    print(f"平移+旋轉+縮放 {len(mesh)} 個三角形: {time.perf_counter() - t:.3f} s")
@@ -0,0 +1,276 @@
+"""
+大量圓–圓、圓–線段交點查詢
+先用均勻網格 (broad phase) 找出外接矩形重疊的候選配對，
+再對所有候選一次向量化計算交點 (narrow phase)，公式與 homework06.Circle 相同。
+"""
+
+import numpy as np
+
+from homework06 import Circle, Line
+
+
+def circle_arrays(circles, radii=None):
+    """接受 Circle 列表，或 (centers, radii) 兩個陣列。"""
+    if radii is None:
+        centers = np.array([(c.center.x, c.center.y) for c in circles], dtype=float).reshape(-1, 2)
+        radii = np.array([c.radius for c in circles], dtype=float)
+        return centers, radii
+    return np.asarray(circles, dtype=float).reshape(-1, 2), np.asarray(radii, dtype=float)
+
+
+def segment_arrays(lines, p2=None):
+    """接受 Line 列表，或 (p1, p2) 兩個 (M, 2) 端點陣列。"""
+    if p2 is None:
+        p1 = np.array([(l.p1.x, l.p1.y) for l in lines], dtype=float).reshape(-1, 2)
+        p2 = np.array([(l.p2.x, l.p2.y) for l in lines], dtype=float).reshape(-1, 2)
+        return p1, p2
+    return np.asarray(lines, dtype=float).reshape(-1, 2), np.asarray(p2, dtype=float).reshape(-1, 2)
+
+
+# 覆蓋超過這麼多格的矩形不放進網格，直接和所有物件比較外接矩形
+MAX_CELLS = 256
+
+
+def _box_cells(c0, c1, ids):
+    """把 ids 中每個矩形展開成它覆蓋的每一格，回傳 (owner, gx, gy)。"""
+    nx = c1[ids, 0] - c0[ids, 0] + 1
+    ny = c1[ids, 1] - c0[ids, 1] + 1
+    owner = np.repeat(ids, nx * ny)
+    k = np.arange(len(owner)) - np.repeat(np.cumsum(nx * ny) - nx * ny, nx * ny)
+    ny = np.repeat(ny, nx * ny)
+    return owner, c0[owner, 0] + k // ny, c0[owner, 1] + k % ny
+
+
+def _segment_cells(p1, p2, origin, cell):
+    """
+    線段只登記到它實際穿過的格子 (DDA)：求出線段與每條格線的交點參數 t，
+    排序後每一小段 [t_i, t_(i+1)] 的中點所在的格子就是穿過的格子，共 |Δgx| + |Δgy| + 1 格。
+    回傳 (owner, gx, gy)，owner 為線段索引。
+    """
+    m = len(p1)
+    d = p2 - p1
+    c0 = np.floor((p1 - origin) / cell).astype(np.int64)
+    c1 = np.floor((p2 - origin) / cell).astype(np.int64)
+    lo, hi = np.minimum(c0, c1), np.maximum(c0, c1)
+
+    owners, ts = [np.arange(m)], [np.zeros(m)]
+    for axis in (0, 1):
+        count = hi[:, axis] - lo[:, axis]
+        owner = np.repeat(np.arange(m), count)
+        k = np.arange(len(owner)) - np.repeat(np.cumsum(count) - count, count)
+        line = origin[axis] + (lo[owner, axis] + 1 + k) * cell
+        owners.append(owner)
+        ts.append((line - p1[owner, axis]) / d[owner, axis])
+
+    owner, t = np.concatenate(owners), np.concatenate(ts)
+    order = np.lexsort((t, owner))
+    owner, t = owner[order], t[order]
+    t_next = np.append(t[1:], 1.0)
+    t_next[np.append(owner[1:] != owner[:-1], True)] = 1.0
+
+    mid = p1[owner] + ((t + t_next) / 2)[:, None] * d[owner]
+    g = np.floor((mid - origin) / cell).astype(np.int64)
+    g = np.clip(g, lo[owner], hi[owner])
+    return owner, g[:, 0], g[:, 1]
+
+
+def candidate_pairs(lo_a, hi_a, lo_b=None, hi_b=None, cell=None, segments_b=None):
+    """
+    均勻網格 broad phase：回傳外接矩形重疊的配對 (K, 2)。
+    只給 a 時找 a 內部的配對 (i < j)；給 b 時找 (a 的索引, b 的索引)。
+    segments_b: b 為線段時給 (p1, p2)，線段只登記到實際穿過的格子，不是整個外接矩形。
+
+    每個矩形登記到它覆蓋的所有格子，同一格中的物件兩兩配對；
+    一組配對只在「兩矩形交集的左下角」所在的格子輸出一次，不必再去重 (有線段時改用 np.unique 去重)。
+    覆蓋超過 MAX_CELLS 格的大矩形不放進網格，直接與其他物件比較。
+    """
+    self_pairs = lo_b is None
+    if self_pairs:
+        lo_b, hi_b = lo_a, hi_a
+    lo = np.concatenate([lo_a, lo_b]) if not self_pairs else lo_a
+    hi = np.concatenate([hi_a, hi_b]) if not self_pairs else hi_a
+    if len(lo) == 0:
+        return np.empty((0, 2), dtype=np.int64)
+
+    if cell is None:
+        cell = float(np.median(np.max(hi - lo, axis=1)))
+    if not cell > 0:
+        cell = 1.0
+    origin = lo.min(axis=0)
+
+    def cell_of(p):
+        return np.floor((p - origin) / cell).astype(np.int64)
+
+    c0, c1 = cell_of(lo), cell_of(hi)
+    width = int(c1[:, 1].max()) + 1
+    na = len(lo_a)
+
+    is_segment = np.zeros(len(lo), dtype=bool)
+    if segments_b is not None:
+        is_segment[na:] = True
+    big = ~is_segment & (np.prod(c1 - c0 + 1, axis=1) > MAX_CELLS)
+
+    owner, gx, gy = _box_cells(c0, c1, np.flatnonzero(~big & ~is_segment))
+    if segments_b is not None:
+        so, sx, sy = _segment_cells(np.asarray(segments_b[0], dtype=float),
+                                    np.asarray(segments_b[1], dtype=float), origin, cell)
+        owner, gx, gy = (np.concatenate(v) for v in ((owner, so + na), (gx, sx), (gy, sy)))
+    cell_id = gx * width + gy
+
+    order = np.argsort(cell_id, kind="stable")
+    cell_id, owner = cell_id[order], owner[order]
+
+    # 同一格的項目在排序後相鄰，位移 k 逐步配對直到沒有任何一格大於 k 個
+    pairs = []
+    for shift in range(1, len(owner)):
+        same = np.flatnonzero(cell_id[:-shift] == cell_id[shift:])
+        if same.size == 0:
+            break
+        i, j = owner[same], owner[same + shift]
+        cid = cell_id[same]
+        if not self_pairs:
+            keep = (i < na) != (j < na)
+            i, j, cid = i[keep], j[keep], cid[keep]
+            i, j = np.minimum(i, j), np.maximum(i, j) - na
+            lo_i, hi_i, lo_j, hi_j = lo_a[i], hi_a[i], lo_b[j], hi_b[j]
+        else:
+            i, j = np.minimum(i, j), np.maximum(i, j)
+            lo_i, hi_i, lo_j, hi_j = lo[i], hi[i], lo[j], hi[j]
+
+        keep = np.all((lo_i <= hi_j) & (lo_j <= hi_i), axis=1)
+        if segments_b is None:
+            ref = cell_of(np.maximum(lo_i, lo_j))
+            keep &= ref[:, 0] * width + ref[:, 1] == cid
+        pairs.append(np.stack([i[keep], j[keep]], axis=1))
+
+    # 大矩形直接與另一邊的所有物件比較 (a 與 b 都是大矩形的配對只由 a 這邊輸出一次)
+    for i in np.flatnonzero(big):
+        if self_pairs:
+            j = np.flatnonzero(~big | (np.arange(len(lo)) > i))
+            j = j[j != i]
+        elif i < na:
+            j = np.arange(na, len(lo))
+        else:
+            j = np.flatnonzero(~big[:na])
+        j = j[np.all((lo[i] <= hi[j]) & (lo[j] <= hi[i]), axis=1)]
+        if self_pairs:
+            pairs.append(np.stack([np.minimum(i, j), np.maximum(i, j)], axis=1))
+        elif i < na:
+            pairs.append(np.stack([np.full(len(j), i), j - na], axis=1))
+        else:
+            pairs.append(np.stack([j, np.full(len(j), i - na)], axis=1))
+
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    pairs = np.concatenate(pairs).astype(np.int64)
+    if segments_b is not None:
+        pairs = np.unique(pairs, axis=0)
+    return pairs
+
+
+def intersect_circles(circles, radii=None, cell=None):
+    """
+    找出所有相交的圓對與交點。
+
+    參數:
+        circles: Circle 列表，或 (N, 2) 圓心陣列 (此時需給 radii)
+        radii: (N,) 半徑陣列
+        cell: 網格大小，預設為外接正方形邊長的中位數
+
+    回傳:
+        (pairs, points, count)：pairs 為 (K, 2) 圓的索引 (i < j)，
+        points 為 (K, 2, 2) 交點座標，count 為 (K,) 交點數 (相切為 1，兩點重複存放)
+    """
+    centers, radii = circle_arrays(circles, radii)
+    pairs = candidate_pairs(centers - radii[:, None], centers + radii[:, None], cell=cell)
+
+    i, j = pairs[:, 0], pairs[:, 1]
+    x0, y0, r0 = centers[i, 0], centers[i, 1], radii[i]
+    x1, y1, r1 = centers[j, 0], centers[j, 1], radii[j]
+    dx = x1 - x0
+    dy = y1 - y0
+    d = np.hypot(dx, dy)
+    hit = (d <= r0 + r1) & (d >= np.abs(r0 - r1)) & (d > 0)
+
+    pairs, x0, y0, r0, r1, dx, dy, d = (v[hit] for v in (pairs, x0, y0, r0, r1, dx, dy, d))
+    a = (r0**2 - r1**2 + d**2) / (2*d)
+    h = np.sqrt(np.maximum(r0**2 - a**2, 0))
+    x2 = x0 + a * dx / d
+    y2 = y0 + a * dy / d
+    rx = -dy * (h / d)
+    ry = dx * (h / d)
+
+    points = np.stack([np.stack([x2 + rx, y2 + ry], axis=1),
+                       np.stack([x2 - rx, y2 - ry], axis=1)], axis=1)
+    count = np.where(h == 0, 1, 2)
+    return pairs, points, count
+
+
+def intersect_circles_segments(circles, radii, lines, p2=None, cell=None):
+    """
+    找出所有圓與線段的交點。無限長直線的外接矩形無界，無法放進網格，所以這裡只處理線段
+    (Circle.intersect_line 中的參數 t 限制在 [0, 1])。
+
+    參數:
+        circles, radii: 同 intersect_circles (circles 為 Circle 列表時 radii 給 None)
+        lines: Line 列表，或 (M, 2) 起點陣列 (此時需給 p2)
+        p2: (M, 2) 終點陣列
+
+    回傳:
+        (pairs, points, count)：pairs 為 (K, 2) 的 (圓索引, 線段索引)，
+        points 為 (K, 2, 2)，count 為 (K,) 落在線段上的交點數，只有一點時放在第一個
+    """
+    centers, radii = circle_arrays(circles, radii)
+    p1, p2 = segment_arrays(lines, p2)
+    pairs = candidate_pairs(centers - radii[:, None], centers + radii[:, None],
+                            np.minimum(p1, p2), np.maximum(p1, p2), cell=cell, segments_b=(p1, p2))
+
+    ci, li = pairs[:, 0], pairs[:, 1]
+    x0, y0 = centers[ci, 0], centers[ci, 1]
+    x1, y1 = p1[li, 0], p1[li, 1]
+    dx = p2[li, 0] - x1
+    dy = p2[li, 1] - y1
+
+    a = dx**2 + dy**2
+    b = 2 * (dx*(x1 - x0) + dy*(y1 - y0))
+    c = (x1 - x0)**2 + (y1 - y0)**2 - radii[ci]**2
+    disc = b**2 - 4*a*c
+    ok = (disc >= 0) & (a > 0)
+
+    sqrt_disc = np.sqrt(np.where(ok, disc, 0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.stack([(-b + sqrt_disc) / (2*a), (-b - sqrt_disc) / (2*a)], axis=1)
+    on = ok[:, None] & (t >= 0) & (t <= 1)
+    on[:, 1] &= disc > 0  # 相切只算一點
+    # 只有第二個根在線段上時，把它移到第一個
+    t[:, 0] = np.where(on[:, 0], t[:, 0], t[:, 1])
+    count = on.sum(axis=1)
+
+    keep = count > 0
+    pairs, t, count = pairs[keep], t[keep], count[keep]
+    x1, y1, dx, dy = x1[keep], y1[keep], dx[keep], dy[keep]
+    t[:, 1] = np.where(count == 2, t[:, 1], t[:, 0])
+    points = np.stack([x1[:, None] + t*dx[:, None], y1[:, None] + t*dy[:, None]], axis=2)
+    return pairs, points, count
+
+
+if __name__ == "__main__":
+    import time
+
+    from homework06 import Point
+
+    circles = [Circle(Point(0, 0), 5), Circle(Point(8, 0), 5), Circle(Point(20, 0), 1)]
+    pairs, points, count = intersect_circles(circles)
+    print(pairs, points[0], circles[0].intersect_circle(circles[1]))
+
+    lines = [Line(Point(-10, 0), Point(10, 0)), Line(Point(0, 0), Point(0, 10))]
+    pairs, points, count = intersect_circles_segments(circles, None, lines)
+    print(pairs.tolist(), count.tolist())
+
+    rng = np.random.default_rng(0)
+    n = 100_000
+    centers = rng.random((n, 2)) * 1000
+    radii = rng.random(n) * 2 + 0.5
+    t = time.perf_counter()
+    pairs, points, count = intersect_circles(centers, radii)
+    print(f"{n} 個圓: {len(pairs)} 對相交, {time.perf_counter() - t:.2f} s")
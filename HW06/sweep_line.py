@@ -0,0 +1,166 @@
+"""
+線段批次求交 (Bentley–Ottmann 掃描線)
+掃描線由左往右移動，狀態結構依掃描線上的 y 值排序，只檢查相鄰線段是否相交，
+共 O((n + k) log n) 次比較 (n 條線段、k 個交點)。
+交點用參數式 / 外積計算，不經過斜率，所以垂直線與平行線不需要特別處理 None。
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+from spatial_index import segment_arrays
+
+
+def _cross(ax, ay, bx, by):
+    return ax * by - ay * bx
+
+
+def segment_intersection(p, q, r, s):
+    """
+    線段 p→q 與 r→s 的交點 (參數式)：p + t(q-p) = r + u(s-r)，0 <= t, u <= 1。
+    平行 (含共線) 時回傳 None。
+    """
+    dx1, dy1 = q[0] - p[0], q[1] - p[1]
+    dx2, dy2 = s[0] - r[0], s[1] - r[1]
+    denom = _cross(dx1, dy1, dx2, dy2)
+    if denom == 0:
+        return None
+    ex, ey = r[0] - p[0], r[1] - p[1]
+    t = _cross(ex, ey, dx2, dy2) / denom
+    u = _cross(ex, ey, dx1, dy1) / denom
+    if t < 0 or t > 1 or u < 0 or u > 1:
+        return None
+    return (p[0] + t * dx1, p[1] + t * dy1)
+
+
+class _Sweep:
+    def __init__(self, p1, p2):
+        # 每條線段的起點為字典序 (x, y) 較小的端點
+        swap = (p1[:, 0] > p2[:, 0]) | ((p1[:, 0] == p2[:, 0]) & (p1[:, 1] > p2[:, 1]))
+        self.a = np.where(swap[:, None], p2, p1).tolist()
+        self.b = np.where(swap[:, None], p1, p2).tolist()
+        self.slope = [float("inf") if a[0] == b[0] else (b[1] - a[1]) / (b[0] - a[0])
+                      for a, b in zip(self.a, self.b)]
+
+        extent = float(np.ptp(np.concatenate([p1, p2]), axis=0).max()) if len(p1) else 1.0
+        self.tol = 1e-9 * max(extent, 1.0)
+
+        self.events = []    # (x, y) 的 heap
+        self.scheduled = {}  # 捨入後的點 -> 事件點
+        self.starts = {}    # 事件點 -> 從這裡開始的線段
+        self.status = []    # 依目前掃描位置的 y 排序的線段
+        self.found = {}     # (i, j) -> 交點
+
+        for i, (a, b) in enumerate(zip(self.a, self.b)):
+            if a == b:
+                continue  # 退化成一點的線段不處理
+            self.starts.setdefault(self._schedule(tuple(a)), []).append(i)
+            self._schedule(tuple(b))
+
+    def _key(self, pt):
+        return (round(pt[0] / self.tol), round(pt[1] / self.tol))
+
+    def _schedule(self, pt):
+        """加入事件點；與已排程的點在容忍度內相同時沿用舊點。"""
+        key = self._key(pt)
+        if key not in self.scheduled:
+            self.scheduled[key] = pt
+            heapq.heappush(self.events, pt)
+        return self.scheduled[key]
+
+    def _y_at(self, i, px, py):
+        a, b = self.a[i], self.b[i]
+        if self.slope[i] == float("inf"):
+            return min(max(py, a[1]), b[1])
+        return a[1] + (px - a[0]) * self.slope[i]
+
+    def _near(self, u, v):
+        return abs(u[0] - v[0]) <= self.tol and abs(u[1] - v[1]) <= self.tol
+
+    def _check(self, i, j, p):
+        """相鄰的兩條線段若在 p 之後相交，排入事件。"""
+        pt = segment_intersection(self.a[i], self.b[i], self.a[j], self.b[j])
+        if pt is None or self._near(pt, p) or pt < p:
+            return
+        self._schedule(pt)
+
+    def run(self):
+        while self.events:
+            p = heapq.heappop(self.events)
+            self._handle(p)
+        return self.found
+
+    def _handle(self, p):
+        px, py = p
+        key = lambda i: self._y_at(i, px, py)
+        lo = bisect_left(self.status, py - self.tol, key=key)
+        hi = bisect_right(self.status, py + self.tol, key=key)
+
+        U = self.starts.get(p, [])
+        through = self.status[lo:hi]                               # L(p) ∪ C(p)
+        C = [i for i in through if not self._near(self.b[i], p)]   # p 在線段內部
+
+        involved = U + through
+        if len(involved) > 1:
+            for x in range(len(involved)):
+                for y in range(x + 1, len(involved)):
+                    i, j = sorted((involved[x], involved[y]))
+                    self.found.setdefault((i, j), p)
+
+        # 移除 L ∪ C，再依 p 右側的順序 (斜率) 放回 U ∪ C
+        new = sorted(U + C, key=lambda i: self.slope[i])
+        self.status[lo:hi] = new
+
+        if not new:
+            if 0 < lo < len(self.status):
+                self._check(self.status[lo - 1], self.status[lo], p)
+        else:
+            if lo > 0:
+                self._check(self.status[lo - 1], new[0], p)
+            end = lo + len(new)
+            if end < len(self.status):
+                self._check(new[-1], self.status[end], p)
+
+
+def intersect_segments(lines, p2=None):
+    """
+    找出所有相交的線段對。
+
+    參數:
+        lines: Line 列表，或 (N, 2) 起點陣列 (此時需給 p2)
+        p2: (N, 2) 終點陣列
+
+    回傳:
+        (pairs, points)：pairs 為 (K, 2) 線段索引 (i < j)，points 為 (K, 2) 交點；
+        端點相接也算相交，共線重疊的線段只在共同的事件點回報
+    """
+    p1, p2 = segment_arrays(lines, p2)
+    found = _Sweep(p1, p2).run()
+    if not found:
+        return np.empty((0, 2), dtype=np.int64), np.empty((0, 2))
+    pairs = np.array(sorted(found), dtype=np.int64)
+    points = np.array([found[tuple(k)] for k in pairs.tolist()], dtype=float)
+    return pairs, points
+
+
+if __name__ == "__main__":
+    import time
+
+    from homework06 import Line, Point
+
+    lines = [Line(Point(0, 0), Point(10, 10)),
+             Line(Point(0, 10), Point(10, 0)),
+             Line(Point(5, -5), Point(5, 20)),
+             Line(Point(20, 20), Point(30, 30))]
+    pairs, points = intersect_segments(lines)
+    print(pairs.tolist(), points.tolist())
+
+    rng = np.random.default_rng(0)
+    n = 20_000
+    p1 = rng.random((n, 2)) * 1000
+    p2 = p1 + rng.normal(size=(n, 2)) * 5
+    t = time.perf_counter()
+    pairs, points = intersect_segments(p1, p2)
+    print(f"{n} 條線段: {len(pairs)} 個交點, {time.perf_counter() - t:.2f} s")
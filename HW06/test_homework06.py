@@ -0,0 +1,59 @@
+import numpy as np
+
+from homework06 import Point, PointArray, Triangle, TriangleArray
+
+
+def test_inplace_update_does_not_change_lazy_children():
+    a = PointArray([[1.0, 0.0]])
+    b = a.translate(1, 0)
+    a.rotate(90, out=a)
+    assert np.allclose(b.coords, [[2.0, 0.0]])
+    assert np.allclose(a.coords, [[0.0, 1.0]])
+
+
+def test_inplace_update_on_lazy_child_keeps_source():
+    a = PointArray([[1.0, 0.0]])
+    b = a.translate(1, 0)
+    b.scale(2, out=b)
+    assert np.allclose(b.coords, [[4.0, 0.0]])
+    assert np.allclose(a.coords, [[1.0, 0.0]])
+
+
+def test_inplace_update_on_unshared_array_reuses_buffer():
+    coords = np.array([[1.0, 0.0], [0.0, 1.0]])
+    a = PointArray(coords)
+    a.scale(3, out=a)
+    assert a.coords is coords
+    assert np.allclose(coords, [[3.0, 0.0], [0.0, 3.0]])
+
+
+def test_points_view_and_slices_are_copy_on_write():
+    tri = TriangleArray(np.arange(12, dtype=float).reshape(2, 3, 2))
+    moved = tri.translate(10, 0)
+    pts = tri.points
+    pts.scale(0, out=pts)
+    part = tri[:1]
+    tri.scale(0, out=tri)
+    assert np.allclose(moved.coords[..., 0], np.arange(0, 12, 2).reshape(2, 3) + 10)
+    assert np.allclose(part.coords, np.arange(6, dtype=float).reshape(1, 3, 2))
+
+
+def test_lazy_chain_matches_eager():
+    rng = np.random.default_rng(0)
+    coords = rng.random((50, 3, 2))
+    lazy = TriangleArray(coords).translate(1, 2).rotate(33).scale(2.5).coords
+    eager = TriangleArray(coords.copy())
+    eager.translate(1, 2, out=eager)
+    eager.rotate(33, out=eager)
+    eager.scale(2.5, out=eager)
+    assert np.allclose(lazy, eager.coords)
+
+
+def test_lazy_triangle_does_not_see_later_changes_to_source_points():
+    t = Triangle(Point(0, 0), Point(1, 0), Point(0, 1))
+    u = t.translate(10, 0)
+    v = u.rotate(90)
+    t.p1.x = 100
+    assert (u.p1.x, u.p1.y) == (10, 0)
+    assert np.allclose([v.p2.x, v.p2.y], [0, 11])
+    assert (t.translate(1, 0).p1.x, t.p1.x) == (101, 100)
@@ -0,0 +1,38 @@
+import numpy as np
+
+from spatial_index import candidate_pairs, intersect_circles_segments
+
+
+def brute_pairs(lo_a, hi_a, lo_b, hi_b):
+    overlap = np.all((lo_a[:, None] <= hi_b[None]) & (lo_b[None] <= hi_a[:, None]), axis=2)
+    return sorted(map(tuple, np.argwhere(overlap)))
+
+
+def test_candidate_pairs_with_large_boxes_matches_brute_force():
+    rng = np.random.default_rng(0)
+    lo_a = rng.random((200, 2)) * 10
+    hi_a = lo_a + rng.random((200, 2)) * rng.choice([0.2, 8], size=(200, 1))
+    lo_b = rng.random((50, 2)) * 10
+    hi_b = lo_b + rng.random((50, 2)) * rng.choice([0.2, 8], size=(50, 1))
+
+    assert sorted(map(tuple, candidate_pairs(lo_a, hi_a, lo_b, hi_b, cell=0.2))) == brute_pairs(lo_a, hi_a, lo_b, hi_b)
+    self_pairs = [(i, j) for i, j in brute_pairs(lo_a, hi_a, lo_a, hi_a) if i < j]
+    assert sorted(map(tuple, candidate_pairs(lo_a, hi_a, cell=0.2))) == self_pairs
+
+
+def test_long_segments_match_brute_force():
+    rng = np.random.default_rng(1)
+    centers = rng.random((3000, 2)) * 100
+    radii = rng.random(3000) + 0.2
+    p1 = rng.random((40, 2)) * 100
+    p2 = rng.random((40, 2)) * 100
+    p2[:5, 0] = p1[:5, 0]  # 垂直線段
+
+    pairs, _, count = intersect_circles_segments(centers, radii, p1, p2)
+
+    d = (p2 - p1)[None]
+    t = np.clip(((centers[:, None] - p1[None]) * d).sum(axis=2) / (d * d).sum(axis=2), 0, 1)
+    near = np.linalg.norm(p1[None] + t[..., None] * d - centers[:, None], axis=2) <= radii[:, None]
+    inside = np.all([np.linalg.norm(p[None] - centers[:, None], axis=2) < radii[:, None] for p in (p1, p2)], axis=0)
+    assert sorted(map(tuple, pairs)) == sorted(map(tuple, np.argwhere(near & ~inside)))
+    assert np.all(count > 0)
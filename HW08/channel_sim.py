@@ -0,0 +1,178 @@
+"""
+蒙地卡羅通道模擬：隨機資料 -> 7-4 漢明碼 -> 通道 -> 解碼，估計各錯誤率 / SNR 下的位元錯誤率 (BER)。
+通道:
+    "bsc"：二元對稱通道，參數為翻轉機率 p
+    "awgn"：BPSK 經加成性白高斯雜訊後硬判決，參數為 Eb/N0 (dB)
+每一輪把試驗分給多個行程，各自使用由 SeedSequence 分出的亂數；
+BER 的 Wilson 信賴區間夠窄時提早停止。並與夏農極限 (06.md) 比較。
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+from hamming import encode_bytes, decode_bytes
+from info import entropy
+
+# 7-4 漢明碼的碼率
+RATE = 4 / 7
+
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+
+class BerPoint(NamedTuple):
+    param: float       # 翻轉機率或 Eb/N0 (dB)
+    ber: float         # 解碼後的位元錯誤率
+    low: float         # Wilson 信賴區間
+    high: float
+    bits: int          # 模擬的資料位元數
+    errors: int
+    corrected: int     # 被糾正的碼字數
+    bound: float       # 碼率 RATE 下夏農極限允許的最低 BER
+    seconds: float
+
+    @property
+    def trials_per_second(self):
+        """每秒模擬的碼字數 (每 4 個資料位元一個碼字)。"""
+        return self.bits / 4 / self.seconds
+
+
+def wilson_interval(k, n, z=1.96):
+    """二項比例 k/n 的 Wilson 信賴區間 (預設 95%)。"""
+    if n == 0:
+        return 0.0, 1.0
+    p = k / n
+    denom = 1 + z**2 / n
+    center = (p + z**2 / (2*n)) / denom
+    half = z * np.sqrt(p*(1 - p)/n + z**2/(4*n*n)) / denom
+    return max(0.0, float(center - half)), min(1.0, float(center + half))
+
+
+def binary_entropy(p):
+    p = np.asarray(p, dtype=float)
+    return entropy(np.stack([p, 1 - p], axis=-1))
+
+
+def capacity(channel, param):
+    """每次通道使用的容量 (bits)。BSC: 1 - h(p)；AWGN (實數、SNR = 2 R Eb/N0): log2(1 + SNR) / 2。"""
+    param = np.asarray(param, dtype=float)
+    if channel == "bsc":
+        return 1 - binary_entropy(param)
+    if channel == "awgn":
+        return 0.5 * np.log2(1 + 2 * RATE * 10**(param / 10))
+    raise ValueError(f"未知的通道: {channel}")
+
+
+def shannon_ber_bound(C, rate=RATE):
+    """
+    以碼率 rate 通過容量 C 的通道時，BER 的理論下限：
+    R (1 - h(Pb)) <= C，即 Pb >= h^{-1}(1 - C/R)；C >= R 時可以任意小。
+    """
+    target = np.clip(1 - np.asarray(C, dtype=float) / rate, 0, 1)
+    lo, hi = np.zeros_like(target), np.full_like(target, 0.5)
+    for _ in range(60):   # h 在 [0, 0.5] 遞增，二分法
+        mid = (lo + hi) / 2
+        below = binary_entropy(mid) < target
+        lo, hi = np.where(below, mid, lo), np.where(below, hi, mid)
+    return np.where(target > 0, hi, 0.0)
+
+
+def _run_trials(channel, param, n_bytes, seed):
+    """在子行程中模擬 n_bytes 個隨機位元組，回傳 (錯誤位元數, 資料位元數, 糾正碼字數)。"""
+    rng = np.random.default_rng(seed)
+    payload = rng.integers(0, 256, n_bytes, dtype=np.uint8)
+    bits = np.unpackbits(np.frombuffer(encode_bytes(payload), dtype=np.uint8))
+
+    if channel == "bsc":
+        bits ^= (rng.random(bits.size) < param).astype(np.uint8)
+    else:
+        sigma = np.sqrt(1 / (2 * RATE * 10**(param / 10)))
+        bits = (1 - 2.0*bits + sigma * rng.standard_normal(bits.size) < 0).astype(np.uint8)
+
+    decoded, stats = decode_bytes(np.packbits(bits))
+    errors = int(_POPCOUNT[payload ^ np.frombuffer(decoded, dtype=np.uint8)].sum())
+    return errors, 8 * n_bytes, stats.corrected
+
+
+def simulate(channel, params, batch_bytes=1 << 18, rel_width=0.1, max_bits=10**9,
+             workers=None, seed=0):
+    """
+    對每個參數模擬到 BER 的信賴區間寬度 <= rel_width * BER，或資料位元數達到 max_bits。
+
+    參數:
+        channel: "bsc" 或 "awgn"
+        params: 翻轉機率或 Eb/N0 (dB) 的列表
+        batch_bytes: 每個任務模擬的位元組數
+        workers: 行程數，預設為 CPU 數；1 表示在目前行程中執行
+        seed: 亂數種子，相同種子與 workers 得到相同結果
+
+    回傳:
+        BerPoint 列表
+    """
+    if channel not in ("bsc", "awgn"):
+        raise ValueError(f"未知的通道: {channel}")
+    workers = workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    seeds = np.random.SeedSequence(seed).spawn(len(params))
+    bounds = shannon_ber_bound(capacity(channel, params))
+
+    results = []
+    try:
+        for param, ss, bound in zip(params, seeds, bounds):
+            errors = bits = corrected = 0
+            t = time.perf_counter()
+            while bits < max_bits:
+                tasks = [(channel, param, batch_bytes, s) for s in ss.spawn(workers)]
+                if pool is None:
+                    outcomes = [_run_trials(*task) for task in tasks]
+                else:
+                    outcomes = list(pool.map(_run_trials, *zip(*tasks)))
+                for e, b, c in outcomes:
+                    errors, bits, corrected = errors + e, bits + b, corrected + c
+                low, high = wilson_interval(errors, bits)
+                if errors and high - low <= rel_width * errors / bits:
+                    break
+            results.append(BerPoint(float(param), errors / bits, low, high, bits, errors,
+                                    corrected, float(bound), time.perf_counter() - t))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return results
+
+
+def plot_ber(channel, results, path=None):
+    """畫出 BER 曲線與夏農極限 (需要 matplotlib)；給 path 時存檔，否則顯示。"""
+    import matplotlib.pyplot as plt
+
+    x = [r.param for r in results]
+    ber = np.array([r.ber for r in results])
+    err = np.array([[r.ber - r.low for r in results], [r.high - r.ber for r in results]])
+    fig, ax = plt.subplots()
+    ax.errorbar(x, ber, yerr=err, marker="o", capsize=3, label="Hamming(7,4)")
+    ax.plot(x, [r.bound for r in results], "--", label="Shannon bound (R = 4/7)")
+    ax.set_yscale("log")
+    ax.set_xlabel("flip probability p" if channel == "bsc" else "Eb/N0 (dB)")
+    ax.set_ylabel("BER")
+    ax.legend()
+    if path:
+        fig.savefig(path)
+    else:
+        plt.show()
+    return fig
+
+
+if __name__ == "__main__":
+    for channel, params in (("bsc", [0.2, 0.1, 0.05, 0.02, 0.01]),
+                            ("awgn", [0, 2, 4, 6, 8])):
+        results = simulate(channel, params, max_bits=10**8)
+        print(f"\n{channel}:")
+        for r in results:
+            print(f"   {r.param:>5}: BER = {r.ber:.3e} [{r.low:.3e}, {r.high:.3e}], "
+                  f"夏農極限 {r.bound:.3e}, {r.bits} bits, {r.trials_per_second:,.0f} 碼字/s")
+        try:
+            plot_ber(channel, results, f"ber_{channel}.png")
+        except ImportError:
+            print("   (未安裝 matplotlib，略過作圖)")
@@ -0,0 +1,146 @@
+"""
+7-4 漢明碼
+G = [P | I4] 為系統碼：碼字前 3 位為同位元，後 4 位就是資料；H = [I3 | P^T] 由 G 推得，
+保證 G H^T = 0。單一碼字的編解碼預先算成查表：
+    ENCODE[16]：4 位元資料 (整數) -> 7 位元碼字 (整數，碼字第 0 位為最高位)
+    DECODE[128]：收到的 7 位元碼字 -> 糾錯後的 4 位元資料
+    CORRECTED[128]：該碼字是否有一位被糾正
+encode_bytes / decode_bytes 把每個位元組拆成兩個 nibble，碼字緊密排成位元流 (每位元組 14 位元)。
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+G = np.array([
+    [1, 1, 0, 1, 0, 0, 0],
+    [1, 0, 1, 0, 1, 0, 0],
+    [0, 1, 1, 0, 0, 1, 0],
+    [1, 1, 1, 0, 0, 0, 1]
+], dtype=int)
+
+H = np.concatenate([np.eye(3, dtype=int), G[:, :3].T], axis=1)
+
+# 碼字中資料所在的位置
+DATA_POSITIONS = [3, 4, 5, 6]
+
+
+def _bits(values, width):
+    """整數 -> 位元陣列 (最高位在前)。"""
+    return (np.asarray(values)[..., None] >> np.arange(width - 1, -1, -1)) & 1
+
+
+def _value(bits):
+    bits = np.asarray(bits)
+    return bits @ (1 << np.arange(bits.shape[-1] - 1, -1, -1))
+
+
+def _build_tables():
+    encode = _value(_bits(np.arange(16), 4) @ G % 2).astype(np.uint8)
+
+    received = _bits(np.arange(128), 7)
+    syndrome = received @ H.T % 2
+    # 症狀等於 H 的第 j 行，表示第 j 位出錯
+    flip = (syndrome[:, None, :] == H.T[None, :, :]).all(axis=2)
+    corrected = received ^ flip
+    decode = _value(corrected[:, DATA_POSITIONS]).astype(np.uint8)
+    return encode, decode, flip.any(axis=1)
+
+
+ENCODE, DECODE, CORRECTED = _build_tables()
+
+# 位元組層級的表 (由上面的表組成)：
+# 一個位元組 (兩個 nibble，高位在前) -> 14 位元；14 位元 -> 位元組 | (糾正數 << 8)
+_ENCODE_BYTE = (ENCODE[np.arange(256) >> 4].astype(np.uint16) << 7) | ENCODE[np.arange(256) & 15]
+_DECODE_14 = ((DECODE[np.arange(1 << 14) >> 7].astype(np.uint16) << 4) | DECODE[np.arange(1 << 14) & 127]
+              | ((CORRECTED[np.arange(1 << 14) >> 7].astype(np.uint16)
+                  + CORRECTED[np.arange(1 << 14) & 127]) << 8))
+
+# 每次處理的組數 (一組 = 4 個原始位元組 = 7 個編碼位元組)，讓暫存陣列留在快取裡
+CHUNK = 1 << 15
+
+
+def hamming_encode(data_bits):
+    """
+    7-4 漢明碼編碼
+    data_bits: 長度為 4 的 numpy array (d4, d3, d2, d1)
+    """
+    data_bits = np.array(data_bits, dtype=int)
+    if data_bits.shape != (4,):
+        raise ValueError("資料位元必須是長度為 4 的向量")
+    return _bits(ENCODE[_value(data_bits)], 7)
+
+
+def hamming_decode(received_codeword):
+    """
+    7-4 漢明碼解碼和糾錯 (糾正一位錯誤)
+    received_codeword: 長度為 7 的 numpy array
+    回傳 (糾錯後碼字, 資料位元)
+    """
+    received_codeword = np.array(received_codeword, dtype=int)
+    if received_codeword.shape != (7,):
+        raise ValueError("接收碼字必須是長度為 7 的向量")
+
+    data_bits = _bits(DECODE[_value(received_codeword)], 4)
+    return hamming_encode(data_bits), data_bits
+
+
+# ------------------- 位元組串流 -------------------
+class DecodeStats(NamedTuple):
+    codewords: int   # 解碼的碼字數
+    corrected: int   # 其中被糾正一位的碼字數
+
+
+def encoded_size(n):
+    """n 個位元組編碼後的位元組數。"""
+    return -(-14 * n // 8)
+
+
+def encode_bytes(data):
+    """
+    編碼 bytes / bytearray / memoryview / uint8 陣列，回傳 bytes。
+    每 4 個位元組剛好是 8 個碼字 = 56 位元 = 7 個位元組，用 uint64 一次組好。
+    """
+    a = np.frombuffer(data, dtype=np.uint8)
+    n = len(a)
+    m = -(-n // 4)
+    src = np.zeros((m, 4), dtype=np.uint8)
+    src.ravel()[:n] = a
+    out = np.empty((m, 7), dtype=np.uint8)
+
+    for s in range(0, m, CHUNK):
+        e = _ENCODE_BYTE[src[s:s + CHUNK]]
+        v = e[:, 0].astype(np.uint64)
+        for j in range(1, 4):
+            v <<= np.uint64(14)
+            v |= e[:, j]
+        out[s:s + CHUNK] = v.astype(">u8").view(np.uint8).reshape(-1, 8)[:, 1:]
+    return out.ravel()[:encoded_size(n)].tobytes()
+
+
+def decode_bytes(data):
+    """
+    解碼 encode_bytes 的輸出 (可能含有錯誤位元)，回傳 (bytes, DecodeStats)。
+    原始長度由編碼長度推回：floor(8 * len / 14)。
+    """
+    a = np.frombuffer(data, dtype=np.uint8)
+    n = 8 * len(a) // 14
+    m = -(-len(a) // 7)
+    src = np.zeros((m, 7), dtype=np.uint8)
+    src.ravel()[:len(a)] = a
+    out = np.empty((m, 4), dtype=np.uint8)
+    corrected = 0
+
+    # 每 7 個位元組前面補一個 0，當成 big-endian uint64
+    buf = np.zeros((min(m, CHUNK), 8), dtype=np.uint8)
+    shifts = np.arange(42, -1, -14, dtype=np.uint64)
+    for s in range(0, m, CHUNK):
+        k = min(CHUNK, m - s)
+        buf[:k, 1:] = src[s:s + k]
+        v = buf[:k].view(">u8").astype(np.uint64)
+        d = _DECODE_14[(v >> shifts) & np.uint64(0x3FFF)]
+        out[s:s + CHUNK] = d
+        # 只計入真正的位元組 (最後一組可能有補上的位置)
+        valid = d.ravel()[:max(0, n - 4 * s)]
+        corrected += int(np.count_nonzero(valid >= 256) + np.count_nonzero(valid >= 512))
+    return out.ravel()[:n].tobytes(), DecodeStats(2 * n, corrected)
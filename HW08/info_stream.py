@@ -0,0 +1,270 @@
+"""
+串流計算熵與互資訊
+不必把整個分佈放進記憶體：逐塊讀入符號序列 (list、陣列或 memmap 檔案)，
+只累計直方圖 X、Y 與聯合次數表 (X, Y)，隨時可以算出 H(X)、H(Y)、H(X,Y)、I(X;Y)。
+兩個部分狀態相加 (merge) 就等於一起累計，所以可以分塊平行計算再合併。
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# 預設每次讀入的符號數
+CHUNK_SIZE = 1 << 22
+
+# 符號上限 (不含)：聯合表的鍵為 x << KEY_BITS | y
+KEY_BITS = 24
+KEY_MASK = (1 << KEY_BITS) - 1
+MAX_SYMBOL = 1 << KEY_BITS
+
+# 聯合次數表 nx * ny 超過這麼多格時改用稀疏表示 (2**22 格的 int64 為 32 MiB)
+MAX_DENSE_JOINT = 1 << 22
+
+
+def _entropy_from_counts(counts, n):
+    """H = log2(n) - Σ c log2(c) / n，只對 c > 0 的項求和。"""
+    if n == 0:
+        return 0.0
+    c = counts[counts > 0].astype(float)
+    return float(np.log2(n) - np.dot(c, np.log2(c)) / n)
+
+
+def _as_symbols(a):
+    a = np.asarray(a).ravel()
+    if a.size and a.dtype.kind not in "iub":
+        raise TypeError("符號必須是非負整數")
+    if a.size and a.dtype.kind == "i" and a.min() < 0:
+        raise ValueError("符號必須是非負整數")
+    return a.astype(np.int64, copy=False)
+
+
+def _check_alphabet(nx, ny):
+    if max(nx, ny) > MAX_SYMBOL:
+        raise ValueError(f"符號必須小於 MAX_SYMBOL = {MAX_SYMBOL}，讀到 {max(nx, ny) - 1}")
+
+
+class InfoCounter:
+    """
+    累計符號 x (以及成對的 y) 的出現次數。
+
+    參數:
+        nx, ny: 符號種類數 (符號為 0 ~ nx-1)；None 時依讀到的最大符號自動擴充
+
+    邊際次數一律用長度 nx、ny 的陣列；聯合次數表在 nx * ny <= MAX_DENSE_JOINT 時用 (nx, ny) 陣列，
+    超過時改成只記出現過的配對 (排序好的鍵 x << KEY_BITS | y 與對應次數)，記憶體只跟不同配對數有關。
+    符號不可超過 MAX_SYMBOL。
+    """
+
+    def __init__(self, nx=None, ny=None):
+        nx, ny = nx or 0, ny or 0
+        _check_alphabet(nx, ny)
+        self.count_x = np.zeros(nx, dtype=np.int64)
+        self.count_y = np.zeros(ny, dtype=np.int64)
+        self.joint = np.zeros((nx, ny), dtype=np.int64) if nx * ny <= MAX_DENSE_JOINT else None
+        self.joint_keys = np.zeros(0, dtype=np.int64)
+        self.joint_counts = np.zeros(0, dtype=np.int64)
+        self.n = 0
+        self.paired = False
+
+    def __repr__(self):
+        kind = "dense" if self.joint is not None else f"sparse, {len(self.joint_keys)} pairs"
+        return f"InfoCounter(n={self.n}, nx={len(self.count_x)}, ny={len(self.count_y)}, {kind})"
+
+    def _grow(self, nx, ny):
+        _check_alphabet(nx, ny)
+        if nx > len(self.count_x):
+            self.count_x = np.concatenate([self.count_x, np.zeros(nx - len(self.count_x), dtype=np.int64)])
+        if ny > len(self.count_y):
+            self.count_y = np.concatenate([self.count_y, np.zeros(ny - len(self.count_y), dtype=np.int64)])
+        if self.joint is None:
+            return
+        nx, ny = len(self.count_x), len(self.count_y)
+        if nx * ny > MAX_DENSE_JOINT:
+            # 聯合表太大，改成稀疏表示
+            self.joint_keys, self.joint_counts = self._joint_items()
+            self.joint = None
+        elif (nx, ny) != self.joint.shape:
+            joint = np.zeros((nx, ny), dtype=np.int64)
+            joint[:self.joint.shape[0], :self.joint.shape[1]] = self.joint
+            self.joint = joint
+
+    def _joint_items(self):
+        """目前的聯合次數，以 (排序好的鍵, 次數) 表示，只含次數 > 0 的配對。"""
+        if self.joint is None:
+            return self.joint_keys, self.joint_counts
+        i, j = np.nonzero(self.joint)
+        return (i.astype(np.int64) << KEY_BITS) | j, self.joint[i, j]
+
+    def _add_joint(self, keys, counts):
+        """把 (鍵, 次數) 加進聯合表；鍵的符號必須已在 _grow 的範圍內。"""
+        if self.joint is not None:
+            np.add.at(self.joint, (keys >> KEY_BITS, keys & KEY_MASK), counts)
+            return
+        keys = np.concatenate([self.joint_keys, keys])
+        counts = np.concatenate([self.joint_counts, counts])
+        order = np.argsort(keys, kind="stable")
+        keys, counts = keys[order], counts[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        self.joint_keys = keys[starts]
+        self.joint_counts = np.add.reduceat(counts, starts) if len(keys) else counts
+
+    def update(self, x, y=None):
+        """加入一塊符號；給 y 時 x、y 必須等長，逐位配成 (x, y)。"""
+        x = _as_symbols(x)
+        if y is None:
+            if self.paired:
+                raise ValueError("此計數器累計的是成對符號，必須同時給 y")
+            if x.size:
+                self._grow(int(x.max()) + 1, 0)
+                self.count_x += np.bincount(x, minlength=len(self.count_x))
+                self.n += x.size
+            return self
+
+        y = _as_symbols(y)
+        if x.shape != y.shape:
+            raise ValueError("x 與 y 的長度必須相同")
+        if self.n and not self.paired:
+            raise ValueError("此計數器累計的是單一序列，不能再加入成對符號")
+        self.paired = True
+        if x.size:
+            self._grow(int(x.max()) + 1, int(y.max()) + 1)
+            self.count_x += np.bincount(x, minlength=len(self.count_x))
+            self.count_y += np.bincount(y, minlength=len(self.count_y))
+            if self.joint is not None:
+                nx, ny = self.joint.shape
+                self.joint += np.bincount(x * ny + y, minlength=nx * ny).reshape(nx, ny)
+            else:
+                self._add_joint(*np.unique((x << KEY_BITS) | y, return_counts=True))
+            self.n += x.size
+        return self
+
+    def merge(self, other):
+        """合併另一個部分狀態 (原地)，回傳 self。"""
+        if self.n and other.n and self.paired != other.paired:
+            raise ValueError("不能合併成對與不成對的計數")
+        self._grow(len(other.count_x), len(other.count_y))
+        self.count_x[:len(other.count_x)] += other.count_x
+        self.count_y[:len(other.count_y)] += other.count_y
+        if self.joint is not None and other.joint is not None:
+            ox, oy = other.joint.shape
+            self.joint[:ox, :oy] += other.joint
+        else:
+            self._add_joint(*other._joint_items())
+        self.n += other.n
+        self.paired = self.paired or other.paired
+        return self
+
+    def __add__(self, other):
+        return InfoCounter().merge(self).merge(other)
+
+    # ------------------- 目前的估計值 -------------------
+    @property
+    def hist_x(self):
+        return self.count_x
+
+    @property
+    def hist_y(self):
+        return self.count_y
+
+    def entropy_x(self):
+        return _entropy_from_counts(self.hist_x, self.n)
+
+    def _require_paired(self):
+        if self.n and not self.paired:
+            raise ValueError("此計數器只累計了 X，沒有 Y 的資料")
+
+    def entropy_y(self):
+        self._require_paired()
+        return _entropy_from_counts(self.hist_y, self.n)
+
+    def joint_entropy(self):
+        self._require_paired()
+        return _entropy_from_counts(self._joint_items()[1], self.n)
+
+    def mutual_information(self):
+        """回傳 (I(X;Y), H(X), H(Y), H(X,Y))，順序與 03.py 的 mutual_information 相同；只累計 X 時為 ValueError。"""
+        H_X, H_Y, H_XY = self.entropy_x(), self.entropy_y(), self.joint_entropy()
+        return H_X + H_Y - H_XY, H_X, H_Y, H_XY
+
+
+def count_chunks(chunks, nx=None, ny=None):
+    """
+    從可迭代的區塊累計次數。每個區塊可以是 x 陣列，或 (x, y) 一對陣列。
+    """
+    counter = InfoCounter(nx, ny)
+    for chunk in chunks:
+        if isinstance(chunk, tuple):
+            counter.update(*chunk)
+        else:
+            counter.update(chunk)
+    return counter
+
+
+def _count_range(path_x, path_y, dtype, start, stop, chunk_size):
+    """在子行程中累計檔案 [start, stop) 這段符號。"""
+    mx = np.memmap(path_x, dtype=dtype, mode="r")
+    my = np.memmap(path_y, dtype=dtype, mode="r") if path_y is not None else None
+    counter = InfoCounter()
+    for s in range(start, stop, chunk_size):
+        e = min(s + chunk_size, stop)
+        counter.update(mx[s:e], None if my is None else my[s:e])
+    return counter
+
+
+def count_file(path_x, path_y=None, dtype=np.uint8, chunk_size=CHUNK_SIZE, workers=1):
+    """
+    用 memmap 逐塊讀取符號檔，回傳 InfoCounter。
+
+    參數:
+        path_x: X 的符號檔 (原始二進位，每個符號一個 dtype)
+        path_y: Y 的符號檔，與 path_x 逐位對應；None 時只算 H(X)
+        dtype: 符號的資料型別
+        chunk_size: 每次讀入的符號數
+        workers: 行程數，None 為 CPU 數；各行程處理一段檔案後再合併
+    """
+    n = os.path.getsize(path_x) // np.dtype(dtype).itemsize
+    if path_y is not None and os.path.getsize(path_y) // np.dtype(dtype).itemsize != n:
+        raise ValueError("X 與 Y 的符號數必須相同")
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or n <= chunk_size:
+        return _count_range(path_x, path_y, dtype, 0, n, chunk_size)
+
+    # 每段長度取 chunk_size 的倍數
+    step = -(-n // (workers * chunk_size)) * chunk_size
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_count_range, path_x, path_y, dtype, s, min(s + step, n), chunk_size)
+                   for s in range(0, n, step)]
+        counter = InfoCounter()
+        for future in futures:
+            counter.merge(future.result())
+    return counter
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    # 與 03.py 的範例相同的聯合分佈 [[0.2, 0.3], [0.1, 0.4]]，用取樣估計
+    rng = np.random.default_rng(0)
+    n = 10_000_000
+    k = rng.choice(4, size=n, p=[0.2, 0.3, 0.1, 0.4])
+    x, y = (k // 2).astype(np.uint8), (k % 2).astype(np.uint8)
+
+    # 分成兩半各自累計再合併，結果與一次累計相同
+    a = count_chunks((x[s:s + CHUNK_SIZE], y[s:s + CHUNK_SIZE]) for s in range(0, n // 2, CHUNK_SIZE))
+    b = count_chunks((x[s:s + CHUNK_SIZE], y[s:s + CHUNK_SIZE]) for s in range(n // 2, n, CHUNK_SIZE))
+    I_XY, H_X, H_Y, H_XY = (a + b).mutual_information()
+    print(f"I(X;Y) = {I_XY:.4f} bits (H(X)={H_X:.4f}, H(Y)={H_Y:.4f}, H(X,Y)={H_XY:.4f})")
+
+    with tempfile.TemporaryDirectory() as d:
+        px, py = os.path.join(d, "x.bin"), os.path.join(d, "y.bin")
+        data = rng.integers(0, 256, size=50_000_000, dtype=np.uint8)
+        data.tofile(px)
+        np.roll(data, 1).tofile(py)
+        for workers in (1, None):
+            t = time.perf_counter()
+            counter = count_file(px, py, workers=workers)
+            print(f"workers={workers}: {counter}, I(X;Y) = {counter.mutual_information()[0]:.6f} bits, "
+                  f"{time.perf_counter() - t:.2f} s")
@@ -0,0 +1,36 @@
+import os
+
+import numpy as np
+import pytest
+
+from info_stream import InfoCounter, count_file
+
+
+def test_x_only_counter_rejects_y_quantities(tmp_path):
+    rng = np.random.default_rng(0)
+    x = rng.integers(0, 65536, size=100_000, dtype=np.uint16)
+    path = os.path.join(tmp_path, "x.bin")
+    x.tofile(path)
+
+    for counter in (count_file(path, dtype=np.uint16), InfoCounter().update(x)):
+        p = np.bincount(x) / len(x)
+        p = p[p > 0]
+        assert counter.entropy_x() == pytest.approx(-np.sum(p * np.log2(p)))
+        for method in (counter.entropy_y, counter.joint_entropy, counter.mutual_information):
+            with pytest.raises(ValueError):
+                method()
+
+
+def test_paired_counter_matches_direct_computation():
+    x = np.array([0, 0, 1, 1, 1, 2])
+    y = np.array([0, 1, 1, 1, 0, 2])
+    I, H_X, H_Y, H_XY = InfoCounter().update(x, y).mutual_information()
+
+    def H(counts):
+        p = np.asarray(counts) / 6
+        return -np.sum(p * np.log2(p))
+
+    assert H_X == pytest.approx(H([2, 3, 1]))
+    assert H_Y == pytest.approx(H([2, 3, 1]))
+    assert H_XY == pytest.approx(H([1, 1, 2, 1, 1]))
+    assert I == pytest.approx(H_X + H_Y - H_XY)
@@ -1,23 +1,7 @@
-import numpy as np
-
-def lu_decomposition(A):
-    A = np.array(A, dtype=float)
-    n = A.shape[0]
-    L = np.eye(n)
-    U = np.zeros((n, n))
-
-    for i in range(n):
-        # 計算 U 的第 i 列
-        for j in range(i, n):
-            U[i, j] = A[i, j] - np.sum(L[i, :i] * U[:i, j])
-
-        # 計算 L 的第 i 欄
-        for j in range(i + 1, n):
-            L[j, i] = (A[j, i] - np.sum(L[j, :i] * U[:i, i])) / U[i, i]
-
-    return L, U
+from det import det
+from lu import lu_decomposition
 
 
 def det_via_lu(A):
-    _, U = lu_decomposition(A)
-    return np.prod(np.diag(U))
+    """部分選主元的 LU (見 det.py)，主元為 0 時不會除以 0；A 也可以是一疊矩陣。"""
+    return det(A)
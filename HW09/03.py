@@ -1,16 +1 @@
-import numpy as np
-
-def lu_decomposition(A):
-    A = np.array(A, dtype=float)
-    n = A.shape[0]
-    L = np.eye(n)
-    U = np.zeros((n, n))
-
-    for i in range(n):
-        for j in range(i, n):
-            U[i, j] = A[i, j] - np.sum(L[i, :i] * U[:i, j])
-
-        for j in range(i + 1, n):
-            L[j, i] = (A[j, i] - np.sum(L[j, :i] * U[:i, i])) / U[i, i]
-
-    return L, U
+from lu import lu_decomposition
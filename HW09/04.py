@@ -1,16 +1,46 @@
 import numpy as np
 
-def svd_from_eig(A):
-    A = np.array(A, dtype=float)
-    ATA = A.T @ A
+def svd_from_eig(A, k=None, rtol=None):
+    """
+    由 A^T A (或 A 較寬時的 A A^T) 的特徵值分解求 SVD：A = U Σ V^T。
+    對稱矩陣用 eigh，特徵值一定是實數；U 的每一欄是 A v_i / σ_i (逐欄縮放，不求 Σ 的反矩陣)。
 
-    eigvals, V = np.linalg.eig(ATA)
-    idx = np.argsort(eigvals)[::-1]
+    參數:
+        k: 只取前 k 個奇異值 (預設 min(m, n)，即 thin SVD)
+        rtol: σ_i <= rtol * σ_max 視為 0；預設 sqrt(max(m, n) * eps)，
+              因為 A^T A 的特徵值誤差約為 eps * σ_max^2
+    回傳:
+        U (m, k)、Σ = np.diag(s) (k, k)、V^T (k, n)；
+        σ 為 0 的方向無法由 A v / σ 得到，U 中對應的欄補成與其他欄正交的單位向量
+    """
+    A = np.asarray(A, dtype=float)
+    m, n = A.shape
+    r = min(m, n)
+    k = r if k is None else min(k, r)
+    if rtol is None:
+        rtol = np.sqrt(max(m, n) * np.finfo(float).eps)
 
-    eigvals = eigvals[idx]
-    V = V[:, idx]
+    wide = m < n
+    M = A if not wide else A.T          # 讓 M 的列數 >= 欄數，Gram 矩陣只有 r x r
+    eigvals, V = np.linalg.eigh(M.T @ M)
+    eigvals, V = eigvals[::-1][:k], V[:, ::-1][:, :k]
 
-    Sigma = np.diag(np.sqrt(eigvals))
-    U = A @ V @ np.linalg.inv(Sigma)
+    s = np.sqrt(np.maximum(eigvals, 0))
+    rank = int(np.count_nonzero(s > rtol * s[0])) if k else 0
+    s[rank:] = 0
 
-    return U, Sigma, V.T
+    U = M @ V[:, :rank]
+    U /= s[:rank]
+    if rank < k:
+        U = np.concatenate([U, _orthonormal_complement(U, k - rank)], axis=1)
+
+    if wide:
+        U, V = V, U
+    return U, np.diag(s), V.T
+
+
+def _orthonormal_complement(Q, count):
+    """與 Q 的各欄正交的 count 個單位向量 (固定種子，結果可重現)。"""
+    G = np.random.default_rng(0).normal(size=(Q.shape[0], count))
+    G -= Q @ (Q.T @ G)
+    return np.linalg.qr(G)[0]
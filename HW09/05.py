@@ -1,11 +1,25 @@
 import numpy as np
 
-def pca(X, k):
+def pca(X, k, solver="exact", n_oversamples=10, n_iter=4, seed=0):
+    """
+    主成分分析，回傳 (Z, 前 k 個特徵值, W)。
+
+    solver:
+        "exact"：對 d x d 共變異數矩陣做特徵值分解
+        "randomized"：Halko–Martinsson–Tropp 隨機化 range finder，只處理 k + n_oversamples 維的子空間，
+                      適合 d 很大而 k 很小的情形；n_iter 為 power iteration 次數，seed 為亂數種子
+    """
     X = np.array(X, dtype=float)
 
     X_mean = X.mean(axis=0)
     X_centered = X - X_mean
 
+    if solver == "randomized":
+        eigvals, W = _randomized_pca(X_centered, k, n_oversamples, n_iter, seed)
+        return X_centered @ W, eigvals, W
+    if solver != "exact":
+        raise ValueError(f"未知的 solver: {solver}")
+
     C = np.cov(X_centered, rowvar=False)
 
     eigvals, eigvecs = np.linalg.eig(C)
@@ -18,3 +32,19 @@ def pca(X, k):
     Z = X_centered @ W
 
     return Z, eigvals[:k], W
+
+
+def _randomized_pca(X_centered, k, n_oversamples, n_iter, seed):
+    """近似 X_centered 的前 k 個右奇異向量；特徵值 = σ^2 / (n - 1)。"""
+    n, d = X_centered.shape
+    size = min(k + n_oversamples, n, d)
+    rng = np.random.default_rng(seed)
+
+    # 隨機投影取得值域的近似基底，每次 power iteration 都重新正交化以免失去精度
+    Q = np.linalg.qr(X_centered @ rng.normal(size=(d, size)))[0]
+    for _ in range(n_iter):
+        Q = np.linalg.qr(X_centered.T @ Q)[0]
+        Q = np.linalg.qr(X_centered @ Q)[0]
+
+    _, s, Vt = np.linalg.svd(Q.T @ X_centered, full_matrices=False)
+    return s[:k]**2 / (n - 1), Vt[:k].T
@@ -0,0 +1,43 @@
+"""
+比較 05.py 的 pca 在 solver="exact" 與 "randomized" 下的時間與精度
+資料的奇異值依 1 / i 遞減 (加上雜訊)，d 在數千維、k 在 10 ~ 50 之間。
+精度指標：前 k 個特徵值的最大相對誤差，以及兩組主成分子空間之間最大主角度的 sin 值。
+"""
+
+import importlib
+import time
+
+import numpy as np
+
+pca = importlib.import_module("05").pca
+
+
+def make_data(n, d, seed=0):
+    rng = np.random.default_rng(seed)
+    r = min(n, d, 200)
+    U = np.linalg.qr(rng.normal(size=(n, r)))[0]
+    V = np.linalg.qr(rng.normal(size=(d, r)))[0]
+    s = 100 / np.arange(1, r + 1)
+    return (U * s) @ V.T + 0.01 * rng.normal(size=(n, d))
+
+
+def subspace_sin(W1, W2):
+    """兩組正交基底張成的子空間之間最大主角度的 sin。"""
+    cos = np.linalg.svd(W1.T @ W2, compute_uv=False)
+    return float(np.sqrt(max(0.0, 1 - cos.min()**2)))
+
+
+def timed(f, *args, **kwargs):
+    t = time.perf_counter()
+    result = f(*args, **kwargs)
+    return result, time.perf_counter() - t
+
+
+if __name__ == "__main__":
+    print(f"{'n':>6} {'d':>5} {'k':>3} {'exact (s)':>10} {'randomized (s)':>15} {'特徵值誤差':>10} {'子空間 sin':>10}")
+    for n, d, k in ((4000, 1000, 10), (4000, 2000, 20), (5000, 3000, 50)):
+        X = make_data(n, d)
+        (_, ev_exact, W_exact), t_exact = timed(pca, X, k)
+        (_, ev_rand, W_rand), t_rand = timed(pca, X, k, solver="randomized", seed=0)
+        err = np.max(np.abs(ev_rand - ev_exact.real) / ev_exact.real)
+        print(f"{n:>6} {d:>5} {k:>3} {t_exact:>10.2f} {t_rand:>15.3f} {err:>12.1e} {subspace_sin(W_exact.real, W_rand):>12.1e}")
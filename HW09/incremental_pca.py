@@ -0,0 +1,143 @@
+"""
+增量 (out-of-core) PCA
+逐塊讀入資料列，只保留筆數 n、平均 mean 與離差矩陣 M = Σ (x - mean)(x - mean)^T (d x d)，
+記憶體只跟維度 d 與每塊大小有關，與總筆數無關。
+兩份部分結果可以用 Chan 等人的公式合併，所以可以分給多個行程各自累計再合併：
+    n = n_a + n_b，δ = mean_b - mean_a
+    mean = mean_a + δ n_b / n
+    M = M_a + M_b + δ δ^T n_a n_b / n
+主成分是共變異數 M / (n - 1) 的特徵向量 (與 05.py 的 pca 相同，np.cov 的 ddof=1)。
+"""
+
+import numpy as np
+
+# fit 每次讀入的列數
+CHUNK_ROWS = 10000
+
+
+class IncrementalPCA:
+    def __init__(self, n_components=None):
+        """n_components: 保留的主成分數，None 表示全部。"""
+        self.n_components = n_components
+        self.n = 0
+        self.mean = None
+        self.scatter = None
+        self._eig = None
+
+    def __repr__(self):
+        d = None if self.mean is None else len(self.mean)
+        return f"IncrementalPCA(n_components={self.n_components}, n={self.n}, d={d})"
+
+    def _merge_stats(self, n_b, mean_b, scatter_b):
+        if n_b == 0:
+            return self
+        if self.n == 0:
+            self.n, self.mean, self.scatter = n_b, mean_b.copy(), scatter_b.copy()
+        else:
+            if mean_b.shape != self.mean.shape:
+                raise ValueError("維度不一致")
+            n = self.n + n_b
+            delta = mean_b - self.mean
+            self.mean += delta * (n_b / n)
+            self.scatter += scatter_b
+            self.scatter += np.outer(delta, delta) * (self.n * n_b / n)
+            self.n = n
+        self._eig = None
+        return self
+
+    def partial_fit(self, X):
+        """加入一塊資料列 (k, d)。"""
+        X = np.asarray(X, dtype=float)
+        if X.ndim == 1:
+            X = X[None, :]
+        if len(X) == 0:
+            return self
+        mean = X.mean(axis=0)
+        Xc = X - mean
+        return self._merge_stats(len(X), mean, Xc.T @ Xc)
+
+    def fit(self, data, chunk_rows=CHUNK_ROWS):
+        """
+        data 可以是 (N, d) 陣列 / np.memmap (逐塊切片讀取)，或產生資料塊的迭代器。
+        """
+        if hasattr(data, "shape"):
+            for s in range(0, data.shape[0], chunk_rows):
+                self.partial_fit(data[s:s + chunk_rows])
+        else:
+            for chunk in data:
+                self.partial_fit(chunk)
+        return self
+
+    def merge(self, other):
+        """合併另一個 (例如其他行程算出的) IncrementalPCA，原地更新並回傳 self。"""
+        return self._merge_stats(other.n, other.mean, other.scatter)
+
+    # ------------------- 結果 -------------------
+    @property
+    def covariance(self):
+        if self.n < 2:
+            raise ValueError("至少需要 2 筆資料")
+        return self.scatter / (self.n - 1)
+
+    def _eigh(self):
+        if self._eig is None:
+            eigvals, eigvecs = np.linalg.eigh(self.covariance)
+            self._eig = np.maximum(eigvals[::-1], 0), eigvecs[:, ::-1]
+        return self._eig
+
+    @property
+    def components(self):
+        """主成分方向 W (d, k)，與 05.py 的 pca 回傳的 W 相同。"""
+        return self._eigh()[1][:, :self.n_components]
+
+    @property
+    def explained_variance(self):
+        return self._eigh()[0][:self.n_components]
+
+    @property
+    def explained_variance_ratio(self):
+        eigvals = self._eigh()[0]
+        return eigvals[:self.n_components] / eigvals.sum()
+
+    def transform(self, X):
+        """投影到主成分：Z = (X - mean) @ W。"""
+        return (np.asarray(X, dtype=float) - self.mean) @ self.components
+
+
+if __name__ == "__main__":
+    import importlib
+    import os
+    import tempfile
+    import time
+
+    pca = importlib.import_module("05").pca
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(5000, 20)) @ rng.normal(size=(20, 20)) + rng.normal(size=20)
+
+    ipca = IncrementalPCA(3).fit(X, chunk_rows=700)
+    Z, eigvals, W = pca(X, 3)
+    # 特徵向量的正負號不唯一，比較絕對值
+    print("特徵值與 pca 相同:", np.allclose(ipca.explained_variance, eigvals),
+          "投影相同:", np.allclose(np.abs(ipca.transform(X)), np.abs(Z)))
+
+    # 兩個「行程」各算一半再合併
+    a = IncrementalPCA(3).fit(X[:1234])
+    b = IncrementalPCA(3).fit(X[1234:])
+    print("合併後相同:", np.allclose(a.merge(b).explained_variance, eigvals),
+          "解釋變異比例:", ipca.explained_variance_ratio.round(3))
+
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "telemetry.f32")
+        big = np.memmap(path, dtype=np.float32, mode="w+", shape=(2_000_000, 50))
+        for s in range(0, len(big), 200_000):
+            big[s:s + 200_000] = rng.normal(size=(200_000, 50)) * np.arange(1, 51)
+        big.flush()
+        del big
+
+        data = np.memmap(path, dtype=np.float32, mode="r").reshape(-1, 50)
+        t = time.perf_counter()
+        ipca = IncrementalPCA(5).fit(data, chunk_rows=100_000)
+        print(f"{data.nbytes / 2**20:.0f} MB memmap: {time.perf_counter() - t:.2f} s, "
+              f"前 5 個變異數 {ipca.explained_variance.round(0)}")
+        del data
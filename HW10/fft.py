@@ -0,0 +1,204 @@
+"""
+快速傅立葉轉換
+N 為 2 的次方時用迭代式 radix-2：先做 bit-reversal 排列，再原地做 log2(N) 層蝴蝶運算，
+每一層對所有蝴蝶一起做 (向量化)。其他長度用 Bluestein (chirp-z)：
+    kn = (k^2 + n^2 - (k-n)^2) / 2
+把 DFT 改寫成長度 >= 2N-1 (取 2 的次方) 的摺積，再用 radix-2 計算。
+總共 O(N log N)。與 homework10 的 dft / idft 定義相同 (正轉換指數為負號，逆轉換除以 N)；
+輸入 list / tuple 時回傳 list，輸入 numpy 陣列時回傳陣列 (沿最後一軸轉換，可以一次轉換多列)。
+排列與旋轉因子存在 FFTPlan 中，依 (N, 方向, dtype) 快取，同樣長度的轉換不必重算。
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+# 快取的計畫總共最多佔用的位元組數
+CACHE_BYTES = 64 * 2**20
+
+FORWARD, INVERSE = -1, 1
+
+
+def _is_power_of_two(n):
+    return n > 0 and n & (n - 1) == 0
+
+
+def _bit_reverse(n):
+    """長度 n (2 的次方) 的 bit-reversal 排列。"""
+    bits = n.bit_length() - 1
+    i = np.arange(n)
+    rev = np.zeros(n, dtype=np.intp)
+    for b in range(bits):
+        rev |= ((i >> b) & 1) << (bits - 1 - b)
+    return rev
+
+
+def _readonly(a):
+    a.flags.writeable = False
+    return a
+
+
+class FFTPlan:
+    """
+    長度 n、方向 sign (FORWARD / INVERSE)、複數型別 dtype 的轉換計畫。
+    建立時算好 bit-reversal 排列與每一層的旋轉因子 (Bluestein 另外算好 chirp 與摺積核的 FFT)，
+    之後每次 execute 只剩算術運算。計畫建好後不再修改，可以在多個執行緒間共用。
+    """
+
+    def __init__(self, n, sign, dtype=np.complex128):
+        self.n, self.sign, self.dtype = n, sign, np.dtype(dtype)
+        self.radix2 = _is_power_of_two(n)
+        if self.radix2:
+            self.rev = _readonly(_bit_reverse(n))
+            self.twiddles = [_readonly(np.exp(sign * 2j * np.pi * np.arange(m // 2) / m).astype(self.dtype))
+                             for m in (2**s for s in range(1, n.bit_length()))]
+        else:
+            self.M = 1 << (2 * n - 2).bit_length()
+            k = np.arange(n)
+            # k^2 先對 2n 取餘數，避免 k 很大時 π k^2 / n 失去精度
+            chirp = np.exp(sign * 1j * np.pi * ((k * k) % (2 * n)) / n)
+            B = np.zeros(self.M, dtype=complex)
+            B[:n] = chirp.conj()
+            B[self.M - n + 1:] = chirp[1:].conj()[::-1]
+            self.forward = get_plan(self.M, FORWARD, self.dtype)
+            self.inverse = get_plan(self.M, INVERSE, self.dtype)
+            self.chirp = _readonly(chirp.astype(self.dtype))
+            # 摺積核的 FFT，並先除以 M (逆轉換未除以 M)
+            self.kernel = _readonly(self.forward.execute(B.astype(self.dtype)) / self.M)
+
+    def __repr__(self):
+        kind = "radix-2" if self.radix2 else "Bluestein"
+        return f"FFTPlan(n={self.n}, sign={self.sign}, dtype={self.dtype}, {kind}, {self.nbytes} bytes)"
+
+    @property
+    def nbytes(self):
+        if self.radix2:
+            return self.rev.nbytes + sum(w.nbytes for w in self.twiddles)
+        # 子計畫另外計入快取
+        return self.chirp.nbytes + self.kernel.nbytes
+
+    def execute(self, a):
+        """轉換 a 的最後一軸 (未除以 n)。radix-2 且 a 為連續陣列時原地計算並回傳 a。"""
+        if self.radix2:
+            if not a.flags.c_contiguous or not a.flags.writeable:
+                a = np.array(a, dtype=self.dtype)
+            return self._radix2(a)
+        return self._bluestein(a)
+
+    def _radix2(self, a):
+        N = self.n
+        a[...] = a[..., self.rev]
+        for w in self.twiddles:
+            h = len(w)
+            v = a.reshape(a.shape[:-1] + (N // (2 * h), 2 * h))
+            t = v[..., h:] * w
+            v[..., h:] = v[..., :h] - t
+            v[..., :h] += t
+        return a
+
+    def _bluestein(self, a):
+        """把長度 n 的 DFT 轉成長度 M (2 的次方) 的摺積。"""
+        A = np.zeros(a.shape[:-1] + (self.M,), dtype=self.dtype)
+        A[..., :self.n] = a * self.chirp
+        self.forward.execute(A)
+        A *= self.kernel
+        self.inverse.execute(A)
+        return A[..., :self.n] * self.chirp
+
+
+_plans = OrderedDict()
+_plans_bytes = 0
+_lock = threading.Lock()
+
+
+def get_plan(n, sign=FORWARD, dtype=np.complex128):
+    """
+    取得 (n, sign, dtype) 的計畫。最近用過的計畫留在 LRU 快取中，總大小超過 CACHE_BYTES 時
+    丟掉最久沒用的 (被丟掉的計畫仍可由持有者繼續使用)。可以在多個執行緒中呼叫。
+    """
+    global _plans_bytes
+    key = (n, sign, np.dtype(dtype))
+    with _lock:
+        plan = _plans.get(key)
+        if plan is not None:
+            _plans.move_to_end(key)
+            return plan
+
+    # 在鎖外建立 (Bluestein 會再呼叫 get_plan 取得子計畫)；兩個執行緒同時建立時採用先放進去的
+    plan = FFTPlan(n, sign, dtype)
+    with _lock:
+        if key in _plans:
+            _plans.move_to_end(key)
+            return _plans[key]
+        _plans[key] = plan
+        _plans_bytes += plan.nbytes
+        while _plans_bytes > CACHE_BYTES and len(_plans) > 1:
+            _, old = _plans.popitem(last=False)
+            _plans_bytes -= old.nbytes
+    return plan
+
+
+def clear_plans():
+    global _plans_bytes
+    with _lock:
+        _plans.clear()
+        _plans_bytes = 0
+
+
+def _transform(x, sign, dtype):
+    as_list = isinstance(x, (list, tuple))
+    a = np.array(x, dtype=dtype)
+    if a.ndim == 0:
+        raise ValueError("輸入必須是序列")
+    N = a.shape[-1]
+    if N > 1:
+        a = get_plan(N, sign, a.dtype).execute(a)
+    if sign == INVERSE and N:
+        a /= N
+    return a.tolist() if as_list else a
+
+
+def fft(x, dtype=np.complex128):
+    """離散傅立葉正轉換 X_k = Σ x_n e^{-2πikn/N}。dtype 可用 np.complex64 省一半記憶體。"""
+    return _transform(x, FORWARD, dtype)
+
+
+def ifft(X, dtype=np.complex128):
+    """逆轉換 x_n = (1/N) Σ X_k e^{2πikn/N}。"""
+    return _transform(X, INVERSE, dtype)
+
+
+if __name__ == "__main__":
+    import time
+
+    from homework10 import dft, idft
+
+    # 以 homework10 的 dft / idft 為標準答案檢查
+    rng = np.random.default_rng(0)
+    for N in (1, 2, 3, 5, 8, 12, 64, 100, 127):
+        x = list(rng.normal(size=N) + 1j * rng.normal(size=N))
+        err = max(abs(p - q) for p, q in zip(fft(x), dft(x)))
+        err_inv = max(abs(p - q) for p, q in zip(ifft(x), idft(x)))
+        print(f"N = {N:>3}: 與 dft 的最大誤差 {err:.1e}, 與 idft {err_inv:.1e}")
+
+    for N in (2**16, 2**20, 10**6, 65537):
+        x = rng.normal(size=N)
+        t = time.perf_counter()
+        X = fft(x)
+        elapsed = time.perf_counter() - t
+        print(f"N = {N}: {elapsed:.3f} s, 與 numpy 的最大誤差 {np.abs(X - np.fft.fft(x)).max():.1e}, "
+              f"還原誤差 {np.abs(ifft(X) - x).max():.1e}")
+
+    # 同樣長度的連續訊框：計畫只建一次，之後每框只剩算術運算
+    frames = rng.normal(size=(2000, 1000))
+    clear_plans()
+    t = time.perf_counter()
+    fft(frames[0])
+    first = time.perf_counter() - t
+    t = time.perf_counter()
+    for frame in frames[1:]:
+        fft(frame)
+    steady = (time.perf_counter() - t) / (len(frames) - 1)
+    print(f"N = 1000 訊框: 第一框 (建立計畫) {first * 1e3:.2f} ms, 之後每框 {steady * 1e3:.3f} ms, 快取 {_plans_bytes} bytes")
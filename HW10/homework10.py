@@ -63,26 +63,27 @@ def simplify_result(complex_list, tolerance=1e-9):
             real_list.append(z) 
     return real_list
 
-f = [1.0, 2.0, 3.0, 4.0]
+if __name__ == "__main__":
+    f = [1.0, 2.0, 3.0, 4.0]
 
-print(f"--- 原始函數 f ---")
-print(f"f = {f}")
+    print(f"--- 原始函數 f ---")
+    print(f"f = {f}")
 
-F = dft(f)
+    F = dft(f)
 
-print("\n--- 正轉換 F(ω) ---")
-print(f"F = {[round(c.real, 4) + round(c.imag, 4) * 1j for c in F]}")
+    print("\n--- 正轉換 F(ω) ---")
+    print(f"F = {[round(c.real, 4) + round(c.imag, 4) * 1j for c in F]}")
 
-f_restored_complex = idft(F)
+    f_restored_complex = idft(F)
 
-print("\n--- 逆轉換 f_restored (複雜結果) ---")
-print(f"f_restored = {[round(c.real, 9) + round(c.imag, 9) * 1j for c in f_restored_complex]}")
+    print("\n--- 逆轉換 f_restored (複雜結果) ---")
+    print(f"f_restored = {[round(c.real, 9) + round(c.imag, 9) * 1j for c in f_restored_complex]}")
 
-f_restored = simplify_result(f_restored_complex)
+    f_restored = simplify_result(f_restored_complex)
 
-print("\n--- 驗證與簡化 (去除極小虛部) ---")
-print(f"f_restored (簡化後) = {[round(x, 4) for x in f_restored]}")
+    print("\n--- 驗證與簡化 (去除極小虛部) ---")
+    print(f"f_restored (簡化後) = {[round(x, 4) for x in f_restored]}")
 
-is_close = all(abs(f[i] - f_restored[i]) < 1e-9 for i in range(len(f)))
+    is_close = all(abs(f[i] - f_restored[i]) < 1e-9 for i in range(len(f)))
 
-print(f"\n驗證結果：原始 f 和還原後的 f_restored 是否相同 (誤差容忍度 1e-9)? **{is_close}**")
\ No newline at end of file
+    print(f"\n驗證結果：原始 f 和還原後的 f_restored 是否相同 (誤差容忍度 1e-9)? **{is_close}**")
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from fft import fft, ifft
+from homework10 import dft, idft
+
+LENGTHS = (1, 2, 3, 4, 5, 8, 12, 16, 64, 100, 127, 128)
+
+
+def random_signal(shape, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=shape) + 1j * rng.normal(size=shape)
+
+
+@pytest.mark.parametrize("N", LENGTHS)
+def test_list_input_matches_dft(N):
+    x = random_signal(N).tolist()
+    X = fft(x)
+    assert isinstance(X, list)
+    np.testing.assert_allclose(X, dft(x), atol=1e-9 * N)
+    x_back = ifft(X)
+    assert isinstance(x_back, list)
+    np.testing.assert_allclose(x_back, idft(X), atol=1e-9 * N)
+    np.testing.assert_allclose(x_back, x, atol=1e-12 * N)
+
+
+@pytest.mark.parametrize("N", LENGTHS)
+def test_array_input_matches_dft(N):
+    x = random_signal(N, seed=N)
+    X = fft(x)
+    assert isinstance(X, np.ndarray) and X.shape == (N,)
+    np.testing.assert_allclose(X, dft(list(x)), atol=1e-9 * N)
+    np.testing.assert_allclose(ifft(x), idft(list(x)), atol=1e-9)
+
+
+@pytest.mark.parametrize("N", (5, 12, 64, 127))
+def test_batched_rows_match_dft(N):
+    x = random_signal((7, N))
+    X, x_inv = fft(x), ifft(x)
+    assert X.shape == x.shape
+    for row, X_row, inv_row in zip(x, X, x_inv):
+        np.testing.assert_allclose(X_row, dft(list(row)), atol=1e-9 * N)
+        np.testing.assert_allclose(inv_row, idft(list(row)), atol=1e-9)
+
+
+def test_real_input_matches_dft():
+    x = np.random.default_rng(1).normal(size=100)
+    np.testing.assert_allclose(fft(x), dft(list(x)), atol=1e-9)
+
+
+@pytest.mark.parametrize("N", (1, 3, 5, 12, 64, 100, 127))
+def test_complex64_matches_dft(N):
+    x = random_signal((3, N))
+    X = fft(x, dtype=np.complex64)
+    assert X.dtype == np.complex64
+    for row, X_row in zip(x, X):
+        np.testing.assert_allclose(X_row, dft(list(row)), rtol=0, atol=1e-4 * N)
+    x_back = ifft(X, dtype=np.complex64)
+    assert x_back.dtype == np.complex64
+    np.testing.assert_allclose(x_back, x, rtol=0, atol=1e-4 * N)
+
+
+def test_empty_input():
+    assert fft([]) == []
+    assert ifft(np.zeros(0)).shape == (0,)
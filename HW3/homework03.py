@@ -1,4 +1,5 @@
 import cmath
+import numpy as np
 
 def root3(a, b, c, d):
     if a == 0:
@@ -28,8 +29,102 @@ def root3(a, b, c, d):
         t3 - shift
     )
 
+def root3_batch(a, b, c, d, check=False):
+    """
+    一次解 N 個實係數三次方程 a x^3 + b x^2 + c x + d = 0。
+    依判別式正負逐列選公式：
+        delta > 0  一實根兩共軛複根，用 Cardano (實數立方根)
+        delta <= 0 三實根，用三角函數解
+
+    參數:
+        a, b, c, d: 形狀 (N,) 的實係數陣列 (或純量，會自動廣播)
+        check: 為 True 時另外回傳每個根代入後的殘差
+
+    回傳:
+        形狀 (N, 3) 的複數根陣列；check=True 時回傳 (roots, residual)
+    """
+    a, b, c, d = np.broadcast_arrays(*(np.atleast_1d(np.asarray(t, dtype=float)) for t in (a, b, c, d)))
+    if np.any(a == 0):
+        raise ValueError("a 不可為 0")
+
+    p = (3*a*c - b*b) / (3*a*a)
+    q = (2*b**3 - 9*a*b*c + 27*a*a*d) / (27*a**3)
+    delta = (q/2)**2 + (p/3)**3
+
+    t = np.empty(a.shape + (3,), dtype=complex)
+
+    # Cardano：A 取與 -q 同號的立方根，B = -p/(3A)，避免 -q/2 + √delta 相減
+    one = delta > 0
+    sqrt_delta = np.sqrt(np.where(one, delta, 0))
+    A = -np.sign(q) * np.cbrt(np.abs(q)/2 + sqrt_delta)
+    A = np.where(q == 0, np.cbrt(sqrt_delta), A)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        B = np.where(A == 0, 0, -p / (3*A))
+    t_real = A + B
+    t_imag = np.sqrt(3)/2 * (A - B)
+    t_cardano = np.stack([t_real + 0j, -t_real/2 + 1j*t_imag, -t_real/2 - 1j*t_imag], axis=-1)
+
+    # 三角函數解：t_k = 2√(-p/3) cos(θ/3 - 2πk/3)
+    m = 2*np.sqrt(np.maximum(-p, 0) / 3)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos_theta = np.where(p < 0, 3*q / (p*m), 0)
+    theta = np.arccos(np.clip(cos_theta, -1, 1))
+    k = np.arange(3)
+    t_trig = m[:, None] * np.cos(theta[:, None]/3 - 2*np.pi*k/3)
+
+    t = np.where(one[:, None], t_cardano, t_trig)
+    roots = t - (b / (3*a))[:, None]
+    roots = _refine_small_roots(roots, one, a, b, c, d)
+
+    if check:
+        residual = np.abs(((a[:, None]*roots + b[:, None])*roots + c[:, None])*roots + d[:, None])
+        return roots, residual
+    return roots
+
+
+def _refine_small_roots(roots, one, a, b, c, d):
+    """
+    減去 b/(3a) 後，絕對值遠小於最大根的根會被抵銷掉 (例如 (1, 1e6, 1, 1))。
+    只保留絕對值最大的根 r，其餘的根用 Vieta 公式由係數重新求出：
+        最大根為實數：另兩根的積 P = -d/(a r)、和 S = (c/a - P)/r，解 x^2 - S x + P = 0
+        最大根為共軛複根 z：實根 = -d/(a |z|^2)
+    """
+    N = len(roots)
+    rows = np.arange(N)
+    # 一實根的列，實根在第 0 欄，共軛複根在第 1、2 欄
+    big = np.where(one, np.where(np.abs(roots[:, 0]) >= np.abs(roots[:, 1]), 0, 1), np.argmax(np.abs(roots), axis=1))
+    r = roots[rows, big]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        P = -d / (a * r.real)
+        S = (c/a - P) / r.real
+
+        # 另兩根為實數時 x = (S + sign(S)√disc)/2，另一根 = P/x，避免相減；disc < 0 時為共軛複根。
+        # 判別式 delta 在係數尺度懸殊時正負號可能算錯，所以這裡依 disc 重新判斷；
+        # disc 只是捨入誤差範圍內的負數 (重根) 時視為實根
+        disc = S*S - 4*P
+        rounding = disc > -8 * np.finfo(float).eps * (S*S + 4*np.abs(P))
+        disc = np.where(rounding, np.maximum(disc, 0), disc)
+        sqrt_disc = np.sqrt(np.abs(disc))
+        x1 = (S + np.where(S >= 0, 1, -1) * sqrt_disc) / 2
+        x2 = np.where(x1 == 0, 0, P / x1)
+        pair = np.where((disc >= 0)[:, None], np.stack([x1, x2], axis=1) + 0j,
+                        np.stack([S/2 + 0.5j*sqrt_disc, S/2 - 0.5j*sqrt_disc], axis=1))
+        real_root = -d / (a * np.abs(r)**2)
+
+    refined = roots.copy()
+    others = np.array([[1, 2], [0, 2], [0, 1]])[big]
+    use_pair = (r != 0) & (~one | (big == 0))
+    refined[rows[use_pair, None], others[use_pair]] = pair[use_pair]
+    use_real = one & (big == 1) & (r != 0)
+    refined[use_real, 0] = real_root[use_real]
+    return refined
+
 
 if __name__ == "__main__":
     roots = root3(1, 0, 0, 1)  # x^3 + 1 = 0
     for r in roots:
         print(r)
+
+    roots, residual = root3_batch([1, 1, 1], [0, -6, 0], [0, 11, -1], [1, -6, 0], check=True)
+    print(roots)
+    print(residual.max())